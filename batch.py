@@ -0,0 +1,87 @@
+"""Bulk lead extraction through the Vertex AI Gemini batch prediction API.
+
+Backfilling leads from many stored conversations one synchronous
+generate_content call at a time runs into the per-minute quota quickly.
+A batch job takes every prompt in one JSONL upload, is billed at the
+discounted batch rate and is collected once it finishes.
+"""
+
+import json
+import time
+import uuid
+
+# Same shape as chatbot.Lead, spelled out in the REST schema format
+LEAD_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "name": {"type": "STRING"},
+        "email": {"type": "STRING"},
+        "phone": {"type": "STRING"},
+        "requirements": {"type": "STRING"},
+    },
+}
+
+
+def batch_extract(conversations, extract_prompt, project, location, bucket,
+                  model="gemini-2.5-flash", poll_interval=30):
+    """Extract lead fields from many conversations with a single batch job.
+
+    Args:
+        conversations: Mapping of conversation id to transcript text
+        extract_prompt: Prompt template with a ``{context}`` placeholder
+        project: Google Cloud project that runs the job
+        location: Vertex AI region, e.g. ``us-central1``
+        bucket: Cloud Storage bucket used for the job's input and output
+        model: Gemini model name
+        poll_interval: Seconds to wait between job status checks
+
+    Yields:
+        (conversation_id, extracted dict) pairs as results are read back
+    """
+    # Imported here so the chatbot only needs the Vertex SDK for backfills
+    import vertexai
+    from google.cloud import storage
+    from vertexai.batch_prediction import BatchPredictionJob
+
+    vertexai.init(project=project, location=location)
+    gcs = storage.Client(project=project).bucket(bucket)
+    prefix = f"aicrm-batch/{uuid.uuid4().hex}"
+
+    # Output rows echo their request, so the prompt text maps results back to ids
+    ids_by_prompt = {}
+    lines = []
+    for conversation_id, context in conversations.items():
+        prompt = extract_prompt.format(context=context)
+        ids_by_prompt[prompt] = conversation_id
+        lines.append(json.dumps({"request": {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "responseMimeType": "application/json",
+                "responseSchema": LEAD_SCHEMA,
+            },
+        }}))
+    gcs.blob(f"{prefix}/input.jsonl").upload_from_string("\n".join(lines))
+
+    job = BatchPredictionJob.submit(
+        source_model=model,
+        input_dataset=f"gs://{bucket}/{prefix}/input.jsonl",
+        output_uri_prefix=f"gs://{bucket}/{prefix}/output",
+    )
+    while not job.has_ended:
+        time.sleep(poll_interval)
+        job.refresh()
+    if not job.has_succeeded:
+        raise RuntimeError(f"Batch extraction job failed: {job.error}")
+
+    for blob in gcs.list_blobs(prefix=f"{prefix}/output"):
+        if not blob.name.endswith(".jsonl"):
+            continue
+        for line in blob.download_as_text().splitlines():
+            row = json.loads(line)
+            prompt = row["request"]["contents"][0]["parts"][0]["text"]
+            try:
+                text = row["response"]["candidates"][0]["content"]["parts"][0]["text"]
+                extracted = json.loads(text)
+            except (KeyError, IndexError, ValueError):
+                extracted = None
+            yield ids_by_prompt.get(prompt), extracted
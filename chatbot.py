@@ -1,30 +1,333 @@
 import streamlit as st
 import google.generativeai as genai
+from google.ai import generativelanguage as glm
+from google.api_core import exceptions as google_exceptions
 import xmlrpc.client
+import asyncio
+import json
+import os
+import random
+import threading
+import time
 import re
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import TypedDict
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from batch import batch_extract
+
+SENTINEL = "[CREATE_LEAD]"
+GEMINI_CONCURRENCY = int(os.environ.get("GEMINI_CONCURRENCY", "10"))
+GEMINI_RETRIES = 5
+# Turns kept in memory and in the Gemini chat; older ones are archived to disk
+MAX_TURNS = 20
+HISTORY_DIR = os.environ.get("AICRM_HISTORY_DIR", "chat_history")
+MAX_LATENCIES = 100
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+# At most two separators between digits, and no newlines, so ranges like
+# "10000 - 20000" and the next line of text are not taken for a phone number;
+# two digit groups joined by a dash ("2024-2025") are a range, not a number
+PHONE_RE = re.compile(r"(?!\d+[ \t]?-[ \t]?\d+(?![ \t().-]{0,2}\d))\+?\d(?:[ \t().-]{0,2}\d){7,}")
+# "Name: ..." / "Email: ..." lines from the assistant's confirmation summary
+SUMMARY_RE = re.compile(r"^\W*(name|email|phone|requirements)\W*:[ \t]*(.+?)[ \t]*$", re.IGNORECASE | re.MULTILINE)
+
+SYSTEM_PROMPT = (
+    "You are a friendly CRM chatbot. Collect: name, email, phone (optional), requirements. "
+    "Once name, email and requirements are known, confirm them on separate lines starting "
+    f'"Name:", "Email:", "Phone:", "Requirements:" and end with {SENTINEL}. '
+    "Otherwise politely ask for what is missing."
+)
+
+EXTRACT_PROMPT = """
+From the following conversation, extract:
+- Name
+- Email
+- Phone (if provided)
+- Requirements
+
+Conversation:
+{context}
+"""
+
+
+class Lead(TypedDict):
+    """Response schema for the Gemini extraction fallback."""
+    name: str
+    email: str
+    phone: str
+    requirements: str
+
+
+class KeepAliveTransport(xmlrpc.client.Transport):
+    """HTTP/1.1 transport that keeps one socket open and serializes access to it.
+
+    The cached Odoo proxies are shared by every Streamlit session, so requests
+    on the single persistent connection must not interleave.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def send_headers(self, connection, headers):
+        super().send_headers(connection, headers + [('Connection', 'keep-alive')])
+
+    def request(self, host, handler, request_body, verbose=False):
+        with self._lock:
+            return super().request(host, handler, request_body, verbose)
+
+
+@st.cache_resource(show_spinner=False)
+def get_odoo(url, db, username, password):
+    """Authenticate against Odoo once per credential set and return (uid, models proxy)."""
+    # Both endpoints share one transport, so create reuses the login's socket
+    transport = KeepAliveTransport()
+    common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common', transport=transport)
+    uid = common.authenticate(db, username, password, {})
+    models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object', transport=transport)
+    return uid, models
+
+
+def get_gemini_api_key():
+    """Read the Gemini key from Streamlit secrets or the environment, if either has one."""
+    try:
+        key = st.secrets.get("GEMINI_API_KEY")
+    except FileNotFoundError:
+        key = None
+    return key or os.environ.get("GEMINI_API_KEY")
+
+
+@st.cache_resource(show_spinner=False)
+def get_model(api_key, name='gemini-2.5-flash', system_instruction=None):
+    """Build a Gemini model once per key so its client channel survives reruns."""
+    model = genai.GenerativeModel(name, system_instruction=system_instruction)
+    # genai.configure sets one client for the whole process, which a model only
+    # picks up on first use; give each model clients that carry their own key
+    # so sessions with different keys never send under each other's
+    model._client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+    model._async_client = glm.GenerativeServiceAsyncClient(client_options={"api_key": api_key})
+    return model
+
+
+def start_chat(chat_model, messages):
+    """Open a Gemini chat session seeded with the given transcript."""
+    history = [
+        {"role": "user" if m["role"] == "user" else "model", "parts": [m["content"]]}
+        for m in messages
+    ]
+    return chat_model.start_chat(history=history)
+
+
+@contextmanager
+def timed(label, sink):
+    """Append how long the block took, in milliseconds, to sink."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sink.append({"stage": label, "ms": round((time.perf_counter() - start) * 1000, 1)})
+
+
+def archive_messages(session_id, messages):
+    """Append messages that fell out of the in-memory window to the session's log."""
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    with open(os.path.join(HISTORY_DIR, f"{session_id}.jsonl"), "a", encoding="utf-8") as f:
+        for message in messages:
+            f.write(json.dumps(message) + "\n")
+
+
+def full_history(session_id, recent):
+    """Return the archived messages followed by the in-memory window."""
+    try:
+        with open(os.path.join(HISTORY_DIR, f"{session_id}.jsonl"), encoding="utf-8") as f:
+            archived = [json_loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        archived = []
+    return archived + recent
+
+
+def extract_lead_locally(messages, confirmation):
+    """Pull lead fields out of the chat without another Gemini round-trip.
+
+    Every field comes from the summary the assistant lists when it confirms
+    the lead. Email and phone fall back to the last match in what the user
+    typed, one message at a time, if the summary line for them is missing
+    or holds no match (e.g. "Email: not given").
+    """
+    summary = {field.lower(): value.strip(" *_") for field, value in SUMMARY_RE.findall(confirmation)}
+    user_texts = [m["content"] for m in messages if m["role"] == "user"]
+
+    def find(pattern, field):
+        matches = pattern.findall(summary.get(field, ""))
+        if not matches:
+            matches = [match for text in user_texts for match in pattern.findall(text)]
+        return matches[-1] if matches else None
+
+    email = find(EMAIL_RE, "email")
+    phone = find(PHONE_RE, "phone")
+    return {
+        "name": summary.get("name") or None,
+        "email": email.rstrip('.') if email else None,
+        "phone": phone.strip() if phone else None,
+        "requirements": summary.get("requirements") or None,
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """Start the background event loop that every session's Gemini/Odoo IO shares."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="aicrm-io", daemon=True).start()
+    return loop
+
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_semaphore():
+    """Cap in-flight async Gemini calls across every session sharing the process."""
+    return asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+
+def lead_payload(extracted):
+    """Map extracted lead fields onto crm.lead values."""
+    name = extracted.get('name') or 'New Lead'
+    return {
+        'name': f'{name} Lead',
+        'contact_name': extracted.get('name'),
+        'email_from': extracted.get('email'),
+        'phone': extracted.get('phone'),
+        'description': extracted.get('requirements'),
+    }
+
+
+def send_with_retry(chat, text):
+    """Start a streamed chat turn, backing off while Gemini reports quota exhaustion."""
+    for attempt in range(GEMINI_RETRIES):
+        try:
+            return chat.send_message(text, stream=True)
+        except google_exceptions.ResourceExhausted:
+            if attempt == GEMINI_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt + random.random())
+
+
+async def generate_with_retry(model, prompt, semaphore, **kwargs):
+    """Async generate_content under the shared concurrency cap, retrying 429s with backoff."""
+    async with semaphore:
+        for attempt in range(GEMINI_RETRIES):
+            try:
+                return await model.generate_content_async(prompt, **kwargs)
+            except google_exceptions.ResourceExhausted:
+                if attempt == GEMINI_RETRIES - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt + random.random())
+
+
+async def extract_and_authenticate(model, extract_prompt, semaphore, latencies, url, db, username, password):
+    """Run the Gemini extraction fallback (if needed) while the Odoo login handshake is in flight."""
+    async def extract():
+        with timed("gemini extract", latencies):
+            return await generate_with_retry(model, extract_prompt, semaphore, generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": Lead,
+            })
+
+    async def authenticate():
+        with timed("odoo authenticate", latencies):
+            return await asyncio.to_thread(get_odoo, url, db, username, password)
+
+    return await asyncio.gather(
+        extract() if extract_prompt else asyncio.sleep(0),
+        authenticate(),
+        return_exceptions=True,
+    )
+
+
+def start_lead_work(transcript, confirmation, model, latencies, url, db, username, password):
+    """Extract what we can locally and start the fallback/Odoo login on the shared loop.
+
+    Returns the locally extracted fields and a future for (extract_response, odoo_session).
+    """
+    extracted = extract_lead_locally(transcript, confirmation)
+
+    # Only ask Gemini when the chat didn't give us every required field
+    extract_prompt = None
+    if not (extracted["name"] and extracted["email"] and extracted["requirements"]):
+        context = "\n".join([f"{m['role']}: {m['content']}" for m in transcript])
+        extract_prompt = EXTRACT_PROMPT.format(context=context)
+    future = asyncio.run_coroutine_threadsafe(extract_and_authenticate(
+        model, extract_prompt, get_gemini_semaphore(), latencies, url, db, username, password
+    ), get_event_loop())
+    return extracted, future
+
 
 # Title
 st.title("Odoo CRM Chatbot with Google Gemini")
 
 # Sidebar for configuration
 st.sidebar.title("Configuration")
-gemini_api_key = st.sidebar.text_input("Google Gemini API Key", type="password")
+gemini_api_key = get_gemini_api_key() or st.sidebar.text_input("Google Gemini API Key", type="password")
 odoo_url = "http://localhost:8069"
 odoo_db = st.sidebar.text_input("Odoo Database Name", value="odoo")
 odoo_username = st.sidebar.text_input("Odoo Username", value="admin")
 odoo_password = st.sidebar.text_input("Odoo Password", type="password")
 
+# Bulk re-extraction of stored conversations through the Vertex AI batch API
+with st.sidebar.expander("Backfill leads"):
+    gcp_project = st.text_input("Google Cloud Project")
+    gcp_location = st.text_input("Vertex AI Region", value="us-central1")
+    gcs_bucket = st.text_input("Cloud Storage Bucket")
+    backfill_file = st.file_uploader("Conversations (JSONL with id and conversation)", type="jsonl")
+    if st.button("Backfill leads", disabled=not (gcp_project and gcs_bucket and backfill_file)):
+        try:
+            conversations = {}
+            for line in backfill_file.getvalue().decode().splitlines():
+                if line.strip():
+                    row = json_loads(line)
+                    conversations[row["id"]] = row["conversation"]
+
+            with st.spinner("Waiting for the batch extraction job..."):
+                leads = [
+                    lead for _, lead in batch_extract(
+                        conversations, EXTRACT_PROMPT, gcp_project, gcp_location, gcs_bucket
+                    ) if lead
+                ]
+
+            uid, models = get_odoo(odoo_url, odoo_db, odoo_username, odoo_password)
+            if uid:
+                # One create call for the whole backfill instead of one per lead
+                lead_ids = models.execute_kw(odoo_db, uid, odoo_password, 'crm.lead', 'create', [
+                    [lead_payload(lead) for lead in leads]
+                ])
+                st.success(f"Created {len(lead_ids)} leads from {len(conversations)} conversations.")
+            else:
+                get_odoo.clear()
+                st.error("Odoo authentication failed. Please check credentials.")
+        except Exception as e:
+            st.error(f"Error backfilling leads: {str(e)}")
+
 if not gemini_api_key:
     st.info("Please enter your Google Gemini API key to continue.")
     st.stop()
 
-genai.configure(api_key=gemini_api_key)
-model = genai.GenerativeModel('gemini-2.5-flash')
+model = get_model(gemini_api_key)
+chat_model = get_model(gemini_api_key, system_instruction=SYSTEM_PROMPT)
 
 # Initialize session state
 if "messages" not in st.session_state:
     st.session_state.messages = []
     st.session_state.lead_info = {"name": None, "email": None, "phone": None, "requirements": None}
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+if "latencies" not in st.session_state:
+    st.session_state.latencies = deque(maxlen=MAX_LATENCIES)
+if "chat" not in st.session_state:
+    st.session_state.chat = start_chat(chat_model, st.session_state.messages)
 
 # Display chat messages
 for message in st.session_state.messages:
@@ -39,78 +342,85 @@ if user_input:
     with st.chat_message("user"):
         st.markdown(user_input)
 
-    # Prepare context
-    context = "\n".join([f"{m['role']}: {m['content']}" for m in st.session_state.messages])
-
-    # System prompt for Gemini
-    system_prompt = """
-You are a helpful CRM chatbot. Engage in natural conversation with the user.
-Your goal is to collect the following information:
-- Name
-- Email
-- Phone (optional)
-- Requirements
-
-Once you have all required information (name, email, requirements), confirm with the user and end your response with the exact phrase: [CREATE_LEAD]
-If information is missing, politely ask for it in a natural way.
-Maintain context from previous messages.
-"""
-
-    # Generate response
-    try:
-        response = model.generate_content(system_prompt + "\n\nConversation:\n" + context)
-        bot_response = response.text
-    except Exception as e:
-        bot_response = f"Error generating response: {str(e)}"
-
-    st.session_state.messages.append({"role": "assistant", "content": bot_response})
+    # Generate response, rendering chunks as they arrive
     with st.chat_message("assistant"):
-        st.markdown(bot_response)
+        placeholder = st.empty()
+        acc = []
+        lead_work = None
+        tail = ""
+        try:
+            with timed("gemini generate", st.session_state.latencies):
+                stream = send_with_retry(st.session_state.chat, user_input)
+                for chunk in stream:
+                    acc.append(chunk.text)
+                    # Only look at the new chunk plus enough carry-over to catch a split sentinel
+                    window = tail + chunk.text
+                    tail = window[-len(SENTINEL):]
+                    if lead_work is None and SENTINEL in window:
+                        # Start extraction and the Odoo login while Gemini streams the rest of the reply
+                        confirmation = "".join(acc).replace(SENTINEL, "")
+                        transcript = full_history(st.session_state.session_id, st.session_state.messages)
+                        lead_work = start_lead_work(
+                            transcript + [{"role": "assistant", "content": confirmation}], confirmation,
+                            model, st.session_state.latencies, odoo_url, odoo_db, odoo_username, odoo_password,
+                        )
+                    placeholder.markdown("".join(acc).replace(SENTINEL, ""))
+            bot_response = "".join(acc).replace(SENTINEL, "").rstrip()
+        except Exception as e:
+            if lead_work is not None:
+                lead_work[1].cancel()
+                lead_work = None
+            bot_response = f"Error generating response: {str(e)}"
+            placeholder.markdown(bot_response)
+            # The failed turn leaves the chat session mid-response; start over from the transcript
+            st.session_state.chat = start_chat(chat_model, st.session_state.messages[:-1])
 
-    # Check if ready to create lead
-    if "[CREATE_LEAD]" in bot_response:
-        # Extract information using Gemini
-        extract_prompt = f"""
-From the following conversation, extract:
-- Name
-- Email
-- Phone (if provided)
-- Requirements
+    st.session_state.messages.append({"role": "assistant", "content": bot_response})
 
-Conversation:
-{context}
+    # Keep per-turn memory and prompt size bounded; the overflow goes to disk
+    window = MAX_TURNS * 2
+    if len(st.session_state.messages) > window:
+        archive_messages(st.session_state.session_id, st.session_state.messages[:-window])
+        st.session_state.messages = st.session_state.messages[-window:]
+        st.session_state.chat.history = st.session_state.chat.history[-window:]
 
-Respond in JSON format: {{"name": "...", "email": "...", "phone": "...", "requirements": "..."}}
-"""
+    # Check if ready to create lead
+    if lead_work is not None:
+        extracted, lead_future = lead_work
+        extract_response, odoo_session = lead_future.result()
         try:
-            extract_response = model.generate_content(extract_prompt)
-            # Parse JSON
-            match = re.search(r'\{.*\}', extract_response.text, re.DOTALL)
-            if match:
-                import json
-                extracted = json.loads(match.group(0))
+            if isinstance(extract_response, Exception):
+                raise extract_response
+            if extract_response is not None:
+                for field, value in json_loads(extract_response.text).items():
+                    if not extracted.get(field):
+                        extracted[field] = value
+            if any(extracted.values()):
                 st.session_state.lead_info = extracted
 
                 # Connect to Odoo
                 try:
-                    common = xmlrpc.client.ServerProxy(f'{odoo_url}/xmlrpc/2/common')
-                    uid = common.authenticate(odoo_db, odoo_username, odoo_password, {})
+                    if isinstance(odoo_session, Exception):
+                        raise odoo_session
+                    uid, models = odoo_session
 
                     if uid:
-                        models = xmlrpc.client.ServerProxy(f'{odoo_url}/xmlrpc/2/object')
-                        lead_id = models.execute_kw(odoo_db, uid, odoo_password, 'crm.lead', 'create', [{
-                            'name': extracted.get('name', 'New Lead') + ' Lead',
-                            'contact_name': extracted.get('name'),
-                            'email_from': extracted.get('email'),
-                            'phone': extracted.get('phone'),
-                            'description': extracted.get('requirements'),
-                        }])
+                        with timed("odoo create", st.session_state.latencies):
+                            lead_id = models.execute_kw(odoo_db, uid, odoo_password, 'crm.lead', 'create', [
+                                lead_payload(extracted)
+                            ])
                         st.success(f"Lead created successfully in Odoo! Lead ID: {lead_id}")
                     else:
+                        # Don't keep a failed login cached for the next attempt
+                        get_odoo.clear()
                         st.error("Odoo authentication failed. Please check credentials.")
                 except Exception as e:
                     st.error(f"Error connecting to Odoo: {str(e)}")
             else:
                 st.error("Failed to extract information.")
         except Exception as e:
-            st.error(f"Error extracting information: {str(e)}")
\ No newline at end of file
+            st.error(f"Error extracting information: {str(e)}")
+
+# Per-stage timings for the most recent calls
+with st.sidebar.expander("Latencies"):
+    st.dataframe(list(st.session_state.latencies), use_container_width=True)
@@ -11,25 +11,278 @@ Compatible with Python 3.x and Odoo's API specifications.
 """
 
 import xmlrpc.client
+import asyncio
+import atexit
+import base64
+import functools
+import gzip
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+import itertools
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import re
 import time
-import sys
-from typing import Dict, List, Any, Union, Optional, Tuple
-from datetime import datetime
+from typing import Dict, List, Any, Union, Optional, Tuple, Iterator, Callable
+from datetime import date, datetime
+from urllib.parse import urlparse
 
-# Configure logging
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# JSON codec for the JSON-RPC wire format: msgspec, then orjson, then the stdlib
+try:
+    import msgspec
+    _json_encode = msgspec.json.Encoder().encode
+    _json_decode = msgspec.json.Decoder().decode
+    def _json_pretty(obj: Any) -> bytes:
+        return msgspec.json.format(_json_encode(obj), indent=2)
+except ImportError:
+    try:
+        import orjson
+        _json_encode = orjson.dumps
+        _json_decode = orjson.loads
+        def _json_pretty(obj: Any) -> bytes:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    except ImportError:
+        def _json_encode(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+        _json_decode = json.loads
+        def _json_pretty(obj: Any) -> bytes:
+            return json.dumps(obj, indent=2).encode()
+
+# XML-RPC marshalling through lxml's C tree builder/parser. The stdlib
+# Marshaller/Unmarshaller stay in use whenever lxml is not installed.
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True) if etree is not None else None
+_XMLRPC_MAXINT = 2**31 - 1
+
+# Encoded argument size above which _execute routes a call over JSON-RPC
+JSONRPC_PAYLOAD_THRESHOLD = 4096
+
+# JSON-RPC request bodies above this size are gzipped when compress_requests is set
+GZIP_MIN_BYTES = 1024
+
+# Seconds an authenticated uid stays valid in the on-disk cache
+UID_CACHE_TTL = 3600
+
+# Most search_read results kept by the search cache
+SEARCH_CACHE_SIZE = 128
+
+# Methods that change records and so invalidate cached search results
+_MUTATING_METHODS = frozenset({'create', 'write', 'unlink', 'web_save'})
+
+
+def _xmlrpc_add_value(parent: Any, value: Any) -> None:
+    """
+    Append a <value> element for a Python object to an lxml element.
+    
+    Args:
+        parent: lxml element to append to
+        value (Any): Value to marshal
+    """
+    node = etree.SubElement(parent, "value")
+    if value is None:
+        etree.SubElement(node, "nil")
+    elif isinstance(value, bool):
+        etree.SubElement(node, "boolean").text = "1" if value else "0"
+    elif isinstance(value, int):
+        tag = "int" if -_XMLRPC_MAXINT - 1 <= value <= _XMLRPC_MAXINT else "i8"
+        etree.SubElement(node, tag).text = str(value)
+    elif isinstance(value, float):
+        etree.SubElement(node, "double").text = repr(value)
+    elif isinstance(value, str):
+        etree.SubElement(node, "string").text = value
+    elif isinstance(value, dict):
+        struct = etree.SubElement(node, "struct")
+        for key, item in value.items():
+            member = etree.SubElement(struct, "member")
+            etree.SubElement(member, "name").text = str(key)
+            _xmlrpc_add_value(member, item)
+    elif isinstance(value, (list, tuple)):
+        data = etree.SubElement(etree.SubElement(node, "array"), "data")
+        for item in value:
+            _xmlrpc_add_value(data, item)
+    elif isinstance(value, (bytes, bytearray)):
+        etree.SubElement(node, "base64").text = base64.b64encode(value).decode("ascii")
+    elif isinstance(value, datetime):
+        etree.SubElement(node, "dateTime.iso8601").text = value.strftime("%Y%m%dT%H:%M:%S")
+    else:
+        raise TypeError(f"cannot marshal {type(value)} objects")
+
+
+def _xmlrpc_dumps_fast(params: tuple, methodname: str) -> bytes:
+    """
+    Serialize an XML-RPC methodCall with lxml.
+    
+    Args:
+        params (tuple): Call parameters
+        methodname (str): Remote method name
+        
+    Returns:
+        bytes: UTF-8 encoded request body
+    """
+    call = etree.Element("methodCall")
+    etree.SubElement(call, "methodName").text = methodname
+    params_node = etree.SubElement(call, "params")
+    for param in params:
+        _xmlrpc_add_value(etree.SubElement(params_node, "param"), param)
+    return etree.tostring(call, xml_declaration=True, encoding="utf-8")
+
+
+def _xmlrpc_parse_value(node: Any) -> Any:
+    """
+    Convert an lxml <value> element back into a Python object.
+    
+    Args:
+        node: lxml <value> element
+        
+    Returns:
+        Any: Unmarshalled value
+    """
+    if len(node) == 0:
+        # A bare <value> holds a string
+        return node.text or ""
+    child = node[0]
+    tag = child.tag
+    if tag == "string":
+        return child.text or ""
+    if tag in ("int", "i4", "i8"):
+        return int(child.text)
+    if tag == "boolean":
+        return child.text.strip() == "1"
+    if tag == "double":
+        return float(child.text)
+    if tag == "nil":
+        return None
+    if tag == "struct":
+        return {
+            member.findtext("name"): _xmlrpc_parse_value(member.find("value"))
+            for member in child.iterfind("member")
+        }
+    if tag == "array":
+        return [_xmlrpc_parse_value(item) for item in child.iterfind("data/value")]
+    if tag == "base64":
+        return base64.b64decode(child.text or "")
+    if tag == "dateTime.iso8601":
+        return datetime.strptime(child.text.strip(), "%Y%m%dT%H:%M:%S")
+    raise ValueError(f"unknown XML-RPC type: {tag}")
+
+
+def _xmlrpc_loads_fast(data: bytes) -> Any:
+    """
+    Parse an XML-RPC methodResponse with lxml.
+    
+    Args:
+        data (bytes): Response body
+        
+    Returns:
+        Any: The single returned value
+        
+    Raises:
+        xmlrpc.client.Fault: If the server returned a fault
+    """
+    root = etree.fromstring(data, _XML_PARSER)
+    fault = root.find("fault/value")
+    if fault is not None:
+        info = _xmlrpc_parse_value(fault)
+        raise xmlrpc.client.Fault(info["faultCode"], info["faultString"])
+    return _xmlrpc_parse_value(root.find("params/param/value"))
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """
+    Encode values msgpack has no native type for, the way the JSON codec does.
+    
+    Dates and datetimes become ISO 8601 strings; msgpack's own timestamp
+    type would reject the naive datetimes Odoo works with.
+    
+    Args:
+        obj (Any): Value msgpack could not pack
+        
+    Returns:
+        Any: Packable replacement
+    """
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"cannot pack {type(obj)} objects")
+
+
+def _jsonrpc_fault(error: Dict[str, Any]) -> xmlrpc.client.Fault:
+    """
+    Wrap a JSON-RPC error object in the Fault an XML-RPC call would raise.
+    
+    Args:
+        error (Dict[str, Any]): The reply's error object
+        
+    Returns:
+        xmlrpc.client.Fault: Fault carrying the error code and message
+    """
+    data = error.get('data') or {}
+    return xmlrpc.client.Fault(error.get('code', 0), data.get('message') or error.get('message', ''))
+
+
+# Configure logging; file writes go through a queue so a slow disk never blocks an RPC call
+_log_queue = queue.SimpleQueue()
+_log_listener = None
+_log_lock = threading.Lock()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("odoo_api.log"),
+        logging.handlers.QueueHandler(_log_queue),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger("odoo_api")
 
+
+def _start_file_logging() -> None:
+    """
+    Start writing queued log records to odoo_api.log, once per process.
+    
+    Deferred until the first OdooAPI is built, so importing the module
+    does not create the log file in the working directory.
+    """
+    global _log_listener
+    with _log_lock:
+        if _log_listener is None:
+            _log_listener = logging.handlers.QueueListener(_log_queue, logging.FileHandler("odoo_api.log"))
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+
+
 class OdooAPI:
     """
     A class to interact with Odoo CRM API using both XML-RPC and JSON-RPC methods.
@@ -44,9 +297,17 @@ class OdooAPI:
         xmlrpc_models (xmlrpc.client.ServerProxy): XML-RPC models endpoint
         jsonrpc_url (str): JSON-RPC URL endpoint
         session_id (str): Session ID for JSON-RPC authentication
+        aio_limit (int): Maximum concurrent connections for async JSON-RPC calls
+        fast_xmlrpc (bool): Marshal XML-RPC calls with lxml instead of xmlrpc.client
+        prefer_jsonrpc (bool): Route every _execute call over JSON-RPC regardless of size
+        compress_requests (bool): Gzip JSON-RPC request bodies above GZIP_MIN_BYTES
+        wire (str): Body format for execute calls, 'json' or 'msgpack'
+        msgpackrpc_url (str): MessagePack RPC endpoint used when wire is 'msgpack'
+        max_workers (int): Threads used for per-record XML-RPC fallbacks in batch operations
+        search_cache_ttl (float): Seconds a search_read result is reused (0 disables the cache)
     """
     
-    def __init__(self, url: str, db: str, username: str, password: str):
+    def __init__(self, url: str, db: str, username: str, password: str, max_workers: int = 8):
         """
         Initialize the OdooAPI class with connection parameters.
         
@@ -55,6 +316,7 @@ class OdooAPI:
             db (str): Database name
             username (str): Username for authentication
             password (str): Password for authentication
+            max_workers (int): Threads used for per-record XML-RPC fallbacks
         """
         self.url = url.rstrip('/')
         self.db = db
@@ -64,11 +326,207 @@ class OdooAPI:
         self.xmlrpc_common = None
         self.xmlrpc_models = None
         self.jsonrpc_url = f"{self.url}/jsonrpc"
+        self.msgpackrpc_url = f"{self.url}/msgpackrpc"
+        self.wire = 'json'
         self.session_id = None
+        # Fixed part of every JSON-RPC envelope; only the id and params vary per call
+        self._jsonrpc_envelope_prefix = b'{"jsonrpc":"2.0","method":"call","id":%d,"params":'
+        self._id_counter = itertools.count(1)
+        # Set when uid was restored from the on-disk cache rather than authenticated
+        self._uid_from_cache = False
+        # Specialised execute_kw callers keyed by (model, method), see _bind
+        self._bound = {}
+        # Cleared when the server rejects web_save (Odoo 16 and older)
+        self._has_web_save = True
+        # Cleared when the server rejects JSON-RPC batch (array) requests
+        self._has_jsonrpc_batch = True
+        # search_read results keyed by query, cleared on any create/write/unlink;
+        # the generation counts those clears so an in-flight search can tell
+        self.search_cache_ttl = 30
+        self._search_cache = {}
+        self._search_generation = 0
+        self._search_lock = threading.Lock()
+        # Field types and Arrow schemas per requested field tuple, see search_read_leads_columnar
+        self._column_types = {}
+        self._arrow_schemas = {}
+        
+        # Pooled HTTP session so JSON-RPC calls reuse keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=3)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Content-Type": "application/json"})
+        
+        # lxml-based XML-RPC marshalling over the pooled session, when available
+        self.fast_xmlrpc = etree is not None
+        self.prefer_jsonrpc = False
+        
+        # Stock Odoo does not decode compressed request bodies; enable this only
+        # behind a proxy or server that does (responses are gzipped either way)
+        self.compress_requests = False
+        
+        # aiohttp session for the async JSON-RPC path, created on first use
+        self.aio_limit = 32
+        self._aio_session = None
+        self._aio_loop = None
+        
+        # ServerProxy is not thread-safe, so each worker thread gets its own
+        self.max_workers = max_workers
+        self._local = threading.local()
         
         # Initialize logger
         self.logger = logger
+        _start_file_logging()
+    
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session and the XML-RPC proxies' connections.
+        """
+        self._session.close()
+        for proxy in (self.xmlrpc_common, self.xmlrpc_models):
+            if proxy is not None:
+                proxy("close")()
+    
+    async def _aio(self) -> 'aiohttp.ClientSession':
+        """
+        Return the aiohttp session for the running event loop, creating it if needed.
+        
+        A session left over from another (possibly closed) event loop is
+        dropped and replaced, so each asyncio.run gets a working session.
+        
+        Returns:
+            aiohttp.ClientSession: Session with a connection pool capped at aio_limit
+        """
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for the async JSON-RPC methods")
+        loop = asyncio.get_running_loop()
+        if self._aio_session is None or self._aio_session.closed or self._aio_loop is not loop:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.aio_limit),
+                headers={"Content-Type": "application/json"}
+            )
+            self._aio_loop = loop
+        return self._aio_session
+    
+    async def aclose(self) -> None:
+        """
+        Close the aiohttp session used by the async JSON-RPC methods.
+        """
+        session, loop = self._aio_session, self._aio_loop
+        self._aio_session = self._aio_loop = None
+        # A session from another event loop can only be closed on that loop
+        if session is not None and loop is asyncio.get_running_loop():
+            await session.close()
+    
+    def _xmlrpc_transport(self) -> xmlrpc.client.Transport:
+        """
+        Create an XML-RPC transport for this server.
+        
+        The stdlib transport keeps its HTTP/1.1 connection open between
+        requests; builtin types skip the DateTime/Binary wrapper objects.
+        
+        Returns:
+            xmlrpc.client.Transport: Transport (or SafeTransport for https URLs)
+        """
+        if self.url.startswith("https://"):
+            return xmlrpc.client.SafeTransport(use_builtin_types=True)
+        return xmlrpc.client.Transport(use_builtin_types=True)
+    
+    def _models_proxy(self) -> xmlrpc.client.ServerProxy:
+        """
+        Get the XML-RPC object endpoint proxy for the current thread.
+        
+        Returns:
+            xmlrpc.client.ServerProxy: Proxy with its own transport for this thread
+        """
+        proxy = getattr(self._local, 'models', None)
+        if proxy is None:
+            proxy = xmlrpc.client.ServerProxy(
+                f"{self.url}/xmlrpc/2/object", transport=self._xmlrpc_transport(), allow_none=True
+            )
+            self._local.models = proxy
+        return proxy
+    
+    def _map(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        Apply fn to every item on a thread pool, preserving order.
+        
+        Args:
+            fn (Callable[[Any], Any]): Function making one blocking RPC
+            items (List[Any]): Items to apply it to
+            
+        Returns:
+            List[Any]: Results in the order of items
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(fn, items))
+    
+    def _uid_cache_path(self) -> str:
+        """
+        Get the on-disk uid cache file for this server, database and user.
+        
+        Returns:
+            str: Path under $XDG_CACHE_HOME/aicrm (~/.cache/aicrm by default)
+        """
+        name = re.sub(r'[^\w.-]', '_', f"uid_{urlparse(self.url).netloc}_{self.db}_{self.username}")
+        cache_dir = os.path.expanduser(os.environ.get('XDG_CACHE_HOME', '~/.cache'))
+        return os.path.join(cache_dir, 'aicrm', name)
+    
+    def _restore_uid(self) -> bool:
+        """
+        Restore uid from the on-disk cache, skipping the authentication round trip.
+        
+        Returns:
+            bool: True if a fresh cached uid was found, False otherwise
+        """
+        path = self._uid_cache_path()
+        try:
+            if time.time() - os.path.getmtime(path) > UID_CACHE_TTL:
+                return False
+            with open(path) as f:
+                self.uid = int(f.read())
+        except (OSError, ValueError):
+            return False
+        self._uid_from_cache = True
+        self.logger.debug("Using cached UID %s", self.uid)
+        return True
+    
+    def _store_uid(self) -> None:
+        """
+        Write the authenticated uid to the on-disk cache.
+        """
+        self._uid_from_cache = False
+        path = self._uid_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(str(self.uid))
+        except OSError as e:
+            self.logger.debug("Could not cache UID: %s", e)
+    
+    def _drop_stale_uid(self, error: Any) -> bool:
+        """
+        Forget a cached uid that the server rejected, so the caller can re-authenticate.
         
+        Args:
+            error (Any): Error or fault returned by the failed call
+            
+        Returns:
+            bool: True if the cached uid was dropped and the call should be retried
+        """
+        message = str(error)
+        if not self._uid_from_cache or ('AccessDenied' not in message and 'Access Denied' not in message):
+            return False
+        self.logger.info("Cached UID rejected, re-authenticating")
+        self._uid_from_cache = False
+        self.uid = None
+        self._bound.clear()
+        try:
+            os.remove(self._uid_cache_path())
+        except OSError:
+            pass
+        return True
+    
     def xmlrpc_authenticate(self) -> bool:
         """
         Authenticate using XML-RPC protocol.
@@ -78,19 +536,30 @@ class OdooAPI:
         """
         try:
             self.logger.info("Authenticating via XML-RPC...")
-            self.xmlrpc_common = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/common")
+            # Both endpoints share one HTTP/1.1 transport, and so one keep-alive socket;
+            # the proxies are built once and reused by later authentications
+            if self.xmlrpc_common is None:
+                transport = self._xmlrpc_transport()
+                self.xmlrpc_common = xmlrpc.client.ServerProxy(
+                    f"{self.url}/xmlrpc/2/common", transport=transport, allow_none=True
+                )
+                self.xmlrpc_models = xmlrpc.client.ServerProxy(
+                    f"{self.url}/xmlrpc/2/object", transport=transport, allow_none=True
+                )
             self.uid = self.xmlrpc_common.authenticate(self.db, self.username, self.password, {})
             
             if self.uid:
-                self.xmlrpc_models = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object")
-                self.logger.info(f"XML-RPC Authentication successful. UID: {self.uid}")
+                self._local.models = self.xmlrpc_models
+                self._bound.clear()
+                self._store_uid()
+                self.logger.info("XML-RPC Authentication successful. UID: %s", self.uid)
                 return True
             else:
                 self.logger.error("XML-RPC Authentication failed")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"XML-RPC Authentication error: {str(e)}")
+            self.logger.error("XML-RPC Authentication error: %s", e)
             return False
     
     def jsonrpc_authenticate(self) -> bool:
@@ -113,31 +582,29 @@ class OdooAPI:
                 "id": 1
             }
             
-            response = requests.post(
-                self.jsonrpc_url,
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"}
-            )
+            response = self._session.post(self.jsonrpc_url, data=_json_encode(payload))
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_decode(response.content)
                 if 'result' in result and result['result']:
                     self.uid = result['result']
                     self.session_id = response.cookies.get('session_id')
-                    self.logger.info(f"JSON-RPC Authentication successful. UID: {self.uid}")
+                    self._bound.clear()
+                    self._store_uid()
+                    self.logger.info("JSON-RPC Authentication successful. UID: %s", self.uid)
                     return True
                 else:
                     self.logger.error("JSON-RPC Authentication failed")
                     return False
             else:
-                self.logger.error(f"JSON-RPC Authentication failed with status code: {response.status_code}")
+                self.logger.error("JSON-RPC Authentication failed with status code: %s", response.status_code)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"JSON-RPC Authentication error: {str(e)}")
+            self.logger.error("JSON-RPC Authentication error: %s", e)
             return False
     
-    def xmlrpc_execute(self, model: str, method: str, *args) -> Any:
+    def xmlrpc_execute(self, model: str, method: str, *args, raise_fault: bool = False) -> Any:
         """
         Execute a method on a model using XML-RPC.
         
@@ -145,238 +612,624 @@ class OdooAPI:
             model (str): The model name
             method (str): The method to execute
             *args: Additional arguments for the method
+            raise_fault (bool): Raise server faults instead of returning None,
+                so callers can tell a rejected call from a lost one
             
         Returns:
             Any: Result of the method execution
+            
+        Raises:
+            xmlrpc.client.Fault: If raise_fault is set and the server returned a fault
         """
         try:
-            if not self.uid or not self.xmlrpc_models:
+            self._invalidate_searches(method)
+            if not self.uid and not self._restore_uid():
                 if not self.xmlrpc_authenticate():
                     return None
                     
-            result = self.xmlrpc_models.execute_kw(
+            if self.fast_xmlrpc:
+                body = _xmlrpc_dumps_fast((self.db, self.uid, self.password, model, method, args), "execute_kw")
+                response = self._session.post(
+                    f"{self.url}/xmlrpc/2/object", data=body, headers={"Content-Type": "text/xml"}
+                )
+                response.raise_for_status()
+                return _xmlrpc_loads_fast(response.content)
+                
+            result = self._models_proxy().execute_kw(
                 self.db, self.uid, self.password, model, method, args
             )
             return result
             
         except Exception as e:
-            self.logger.error(f"XML-RPC execution error: {str(e)}")
+            if self._drop_stale_uid(e):
+                return self.xmlrpc_execute(model, method, *args, raise_fault=raise_fault)
+            if raise_fault and isinstance(e, xmlrpc.client.Fault):
+                raise
+            self.logger.error("XML-RPC execution error: %s", e)
             return None
     
-    def jsonrpc_execute(self, model: str, method: str, *args) -> Any:
+    def _invalidate_searches(self, method: str) -> None:
         """
-        Execute a method on a model using JSON-RPC.
+        Drop cached search results before a call that changes records.
         
         Args:
-            model (str): The model name
-            method (str): The method to execute
-            *args: Additional arguments for the method
+            method (str): The method about to be executed
+        """
+        if method in _MUTATING_METHODS:
+            with self._search_lock:
+                self._search_generation += 1
+                self._search_cache.clear()
+    
+    def _cached_search(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a search_read result that is younger than search_cache_ttl.
+        
+        Args:
+            key (tuple): Query key built by search_read_leads_jsonrpc
             
         Returns:
-            Any: Result of the method execution
+            Optional[List[Dict[str, Any]]]: Copy of the cached leads or None on a miss
         """
-        try:
-            if not self.uid:
-                if not self.jsonrpc_authenticate():
-                    return None
-                    
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "call",
-                "params": {
-                    "service": "object",
-                    "method": "execute_kw",
-                    "args": [self.db, self.uid, self.password, model, method, args]
-                },
-                "id": int(time.time())
-            }
-            
-            cookies = {}
-            if self.session_id:
-                cookies['session_id'] = self.session_id
-                
-            response = requests.post(
-                self.jsonrpc_url,
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-                cookies=cookies
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'result' in result:
-                    return result['result']
-                elif 'error' in result:
-                    self.logger.error(f"JSON-RPC execution error: {result['error']}")
-                    return None
-            else:
-                self.logger.error(f"JSON-RPC execution failed with status code: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            self.logger.error(f"JSON-RPC execution error: {str(e)}")
+        entry = self._search_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.search_cache_ttl:
             return None
+        return [dict(lead) for lead in entry[1]]
     
-    # CRUD Operations for CRM Leads
+    def _store_search(self, key: tuple, generation: int, leads: List[Dict[str, Any]]) -> None:
+        """
+        Cache a copy of a search_read result, evicting expired and then oldest entries.
+        
+        Nothing is stored if records changed while the search was in flight.
+        
+        Args:
+            key (tuple): Query key built by search_read_leads_jsonrpc
+            generation (int): _search_generation when the search was sent
+            leads (List[Dict[str, Any]]): Search result
+        """
+        if not self.search_cache_ttl:
+            return
+        now = time.monotonic()
+        with self._search_lock:
+            if generation != self._search_generation:
+                return
+            cache = self._search_cache
+            for stale in [k for k, (stamp, _) in cache.items() if now - stamp > self.search_cache_ttl]:
+                del cache[stale]
+            cache.pop(key, None)
+            while len(cache) >= SEARCH_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = (now, [dict(lead) for lead in leads])
     
-    def create_lead_xmlrpc(self, lead_data: Dict[str, Any]) -> int:
+    def _check_wire(self) -> None:
         """
-        Create a new lead using XML-RPC.
+        Drop back to JSON if MessagePack is selected but msgpack is not installed.
+        """
+        if self.wire == 'msgpack' and msgpack is None:
+            self.logger.warning("msgpack is not installed, falling back to JSON-RPC")
+            self.wire = 'json'
+    
+    def _msgpack_body(self, params: Dict[str, Any]) -> bytes:
+        """
+        Encode a request envelope for the MessagePack endpoint.
         
         Args:
-            lead_data (Dict[str, Any]): Lead data dictionary
+            params (Dict[str, Any]): JSON-RPC request params
             
         Returns:
-            int: ID of the created lead or None if failed
+            bytes: Request body
         """
-        try:
-            self.logger.info("Creating lead via XML-RPC...")
-            lead_id = self.xmlrpc_execute('crm.lead', 'create', [lead_data])
-            if lead_id:
-                self.logger.info(f"Lead created successfully with ID: {lead_id}")
-            return lead_id
-        except Exception as e:
-            self.logger.error(f"Error creating lead via XML-RPC: {str(e)}")
-            return None
+        payload = {"jsonrpc": "2.0", "method": "call", "id": next(self._id_counter), "params": params}
+        return msgpack.packb(payload, use_bin_type=True, default=_msgpack_default)
     
-    def create_lead_jsonrpc(self, lead_data: Dict[str, Any]) -> int:
+    def _jsonrpc_request(self, params: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
         """
-        Create a new lead using JSON-RPC.
+        POST an RPC payload in the configured wire format and decode the reply.
+        
+        With wire='msgpack' the payload goes to the MessagePack endpoint; if the
+        server answers 404/415 the client switches to JSON for good.
         
         Args:
-            lead_data (Dict[str, Any]): Lead data dictionary
+            params (Dict[str, Any]): JSON-RPC request params
             
         Returns:
-            int: ID of the created lead or None if failed
+            Tuple[int, Optional[Dict[str, Any]]]: HTTP status code and decoded body (None unless 200)
         """
-        try:
-            self.logger.info("Creating lead via JSON-RPC...")
-            lead_id = self.jsonrpc_execute('crm.lead', 'create', [lead_data])
-            if lead_id:
-                self.logger.info(f"Lead created successfully with ID: {lead_id}")
-            return lead_id
-        except Exception as e:
-            self.logger.error(f"Error creating lead via JSON-RPC: {str(e)}")
-            return None
+        self._check_wire()
+        if self.wire == 'msgpack':
+            response = self._session.post(
+                self.msgpackrpc_url,
+                data=self._msgpack_body(params),
+                headers={"Content-Type": "application/msgpack"}
+            )
+            if response.status_code not in (404, 415):
+                if response.status_code != 200:
+                    return response.status_code, None
+                return 200, msgpack.unpackb(response.content, raw=False, timestamp=3)
+            self.logger.warning("MessagePack RPC endpoint unavailable, falling back to JSON-RPC")
+            self.wire = 'json'
+        
+        # The session's cookie jar carries session_id from authentication
+        body, headers = self._compress(self._jsonrpc_body(params))
+        response = self._session.post(self.jsonrpc_url, data=body, headers=headers)
+        if response.status_code != 200:
+            return response.status_code, None
+        return 200, _json_decode(response.content)
     
-    def read_lead_xmlrpc(self, lead_id: int, fields: List[str] = None) -> Dict[str, Any]:
+    def _execute_kw_params(self, model: str, method: str, args: tuple) -> Dict[str, Any]:
         """
-        Read a lead using XML-RPC.
+        Build the JSON-RPC params for an execute_kw call.
         
         Args:
-            lead_id (int): ID of the lead to read
-            fields (List[str], optional): List of fields to read. Defaults to None (all fields).
+            model (str): The model name
+            method (str): The method to execute
+            args (tuple): Arguments for the method
             
         Returns:
-            Dict[str, Any]: Lead data or None if failed
+            Dict[str, Any]: JSON-RPC request params
         """
-        try:
-            self.logger.info(f"Reading lead {lead_id} via XML-RPC...")
-            if fields is None:
-                fields = []
-            lead_data = self.xmlrpc_execute('crm.lead', 'read', [lead_id], {'fields': fields})
-            if lead_data and len(lead_data) > 0:
-                self.logger.info(f"Lead {lead_id} read successfully")
-                return lead_data[0]
-            else:
-                self.logger.warning(f"Lead {lead_id} not found")
-                return None
-        except Exception as e:
-            self.logger.error(f"Error reading lead {lead_id} via XML-RPC: {str(e)}")
-            return None
+        return {
+            "service": "object",
+            "method": "execute_kw",
+            "args": [self.db, self.uid, self.password, model, method, args]
+        }
     
-    def read_lead_jsonrpc(self, lead_id: int, fields: List[str] = None) -> Dict[str, Any]:
+    def _compress(self, body: bytes) -> Tuple[bytes, Optional[Dict[str, str]]]:
         """
-        Read a lead using JSON-RPC.
+        Gzip a JSON-RPC request body if compression is enabled and it is large enough.
         
         Args:
-            lead_id (int): ID of the lead to read
-            fields (List[str], optional): List of fields to read. Defaults to None (all fields).
+            body (bytes): Encoded request body
             
         Returns:
-            Dict[str, Any]: Lead data or None if failed
+            Tuple[bytes, Optional[Dict[str, str]]]: Body to send and any extra headers
         """
-        try:
-            self.logger.info(f"Reading lead {lead_id} via JSON-RPC...")
-            if fields is None:
-                fields = []
-            lead_data = self.jsonrpc_execute('crm.lead', 'read', [lead_id], {'fields': fields})
-            if lead_data and len(lead_data) > 0:
-                self.logger.info(f"Lead {lead_id} read successfully")
-                return lead_data[0]
-            else:
-                self.logger.warning(f"Lead {lead_id} not found")
-                return None
-        except Exception as e:
-            self.logger.error(f"Error reading lead {lead_id} via JSON-RPC: {str(e)}")
-            return None
+        if not self.compress_requests or len(body) <= GZIP_MIN_BYTES:
+            return body, None
+        return gzip.compress(body, compresslevel=1), {"Content-Encoding": "gzip"}
     
-    def update_lead_xmlrpc(self, lead_id: int, lead_data: Dict[str, Any]) -> bool:
+    def _jsonrpc_body(self, params: Dict[str, Any]) -> bytes:
         """
-        Update a lead using XML-RPC.
+        Encode a JSON-RPC request by splicing params into the pre-encoded envelope.
         
         Args:
-            lead_id (int): ID of the lead to update
-            lead_data (Dict[str, Any]): Updated lead data
+            params (Dict[str, Any]): JSON-RPC request params
             
         Returns:
-            bool: True if successful, False otherwise
+            bytes: Request body
         """
-        try:
-            self.logger.info(f"Updating lead {lead_id} via XML-RPC...")
-            result = self.xmlrpc_execute('crm.lead', 'write', [lead_id], lead_data)
-            if result:
-                self.logger.info(f"Lead {lead_id} updated successfully")
-            else:
-                self.logger.warning(f"Failed to update lead {lead_id}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Error updating lead {lead_id} via XML-RPC: {str(e)}")
-            return False
+        return self._jsonrpc_envelope_prefix % next(self._id_counter) + _json_encode(params) + b'}'
     
-    def update_lead_jsonrpc(self, lead_id: int, lead_data: Dict[str, Any]) -> bool:
+    def _batch_body(self, calls: List[Tuple[str, str, tuple]]) -> Tuple[List[int], bytes]:
         """
-        Update a lead using JSON-RPC.
+        Encode execute_kw calls as one JSON-RPC batch (a JSON array of requests).
         
         Args:
-            lead_id (int): ID of the lead to update
-            lead_data (Dict[str, Any]): Updated lead data
+            calls (List[Tuple[str, str, tuple]]): (model, method, args) for each call
             
         Returns:
-            bool: True if successful, False otherwise
+            Tuple[List[int], bytes]: Request id of each call and the request body
         """
-        try:
-            self.logger.info(f"Updating lead {lead_id} via JSON-RPC...")
-            result = self.jsonrpc_execute('crm.lead', 'write', [lead_id], lead_data)
-            if result:
-                self.logger.info(f"Lead {lead_id} updated successfully")
-            else:
-                self.logger.warning(f"Failed to update lead {lead_id}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Error updating lead {lead_id} via JSON-RPC: {str(e)}")
-            return False
+        ids = [next(self._id_counter) for _ in calls]
+        body = b'[' + b','.join(
+            self._jsonrpc_envelope_prefix % request_id
+            + _json_encode(self._execute_kw_params(model, method, args)) + b'}'
+            for request_id, (model, method, args) in zip(ids, calls)
+        ) + b']'
+        return ids, body
     
-    def delete_lead_xmlrpc(self, lead_id: int) -> bool:
+    def _batch_results(self, ids: List[int], replies: List[Dict[str, Any]]) -> List[Any]:
         """
-        Delete a lead using XML-RPC.
+        Match JSON-RPC batch replies back to their requests by id.
         
         Args:
-            lead_id (int): ID of the lead to delete
+            ids (List[int]): Request ids in call order
+            replies (List[Dict[str, Any]]): Decoded batch response, in any order
             
         Returns:
-            bool: True if successful, False otherwise
+            List[Any]: Result of each call in order, None for calls that failed
         """
-        try:
-            self.logger.info(f"Deleting lead {lead_id} via XML-RPC...")
-            result = self.xmlrpc_execute('crm.lead', 'unlink', [lead_id])
-            if result:
-                self.logger.info(f"Lead {lead_id} deleted successfully")
+        by_id = {reply.get('id'): reply for reply in replies}
+        results = []
+        for request_id in ids:
+            reply = by_id.get(request_id, {})
+            if 'error' in reply:
+                self.logger.error("JSON-RPC execution error: %s", reply['error'])
+            results.append(reply.get('result'))
+        return results
+    
+    def jsonrpc_execute(self, model: str, method: str, *args, raise_fault: bool = False) -> Any:
+        """
+        Execute a method on a model using JSON-RPC.
+        
+        Args:
+            model (str): The model name
+            method (str): The method to execute
+            *args: Additional arguments for the method
+            raise_fault (bool): Raise JSON-RPC error replies instead of returning None,
+                so callers can tell a rejected call from a lost one
+            
+        Returns:
+            Any: Result of the method execution
+            
+        Raises:
+            xmlrpc.client.Fault: If raise_fault is set and the server returned an error
+        """
+        try:
+            self._invalidate_searches(method)
+            if not self.uid and not self._restore_uid():
+                if not self.jsonrpc_authenticate():
+                    return None
+                    
+            params = self._execute_kw_params(model, method, args)
+            status, result = self._jsonrpc_request(params)
+            
+            if status == 200:
+                if 'result' in result:
+                    return result['result']
+                elif 'error' in result:
+                    if self._drop_stale_uid(result['error']):
+                        return self.jsonrpc_execute(model, method, *args, raise_fault=raise_fault)
+                    if raise_fault:
+                        raise _jsonrpc_fault(result['error'])
+                    self.logger.error("JSON-RPC execution error: %s", result['error'])
+                    return None
+            else:
+                self.logger.error("JSON-RPC execution failed with status code: %s", status)
+                return None
+                
+        except xmlrpc.client.Fault:
+            raise
+        except Exception as e:
+            self.logger.error("JSON-RPC execution error: %s", e)
+            return None
+    
+    def _bind(self, model: str, method: str) -> Callable[..., Any]:
+        """
+        Return a JSON-RPC caller specialised for one (model, method) pair.
+        
+        The envelope, credentials, model and method are encoded once, so a
+        call only encodes its own arguments before posting. Callers are
+        cached until the next authentication. Before authentication, or
+        with the MessagePack wire, this falls back to jsonrpc_execute.
+        
+        Args:
+            model (str): The model name
+            method (str): The method to execute
+            
+        Returns:
+            Callable[..., Any]: Function taking the method arguments, with jsonrpc_execute's return contract
+        """
+        bound = self._bound.get((model, method))
+        if bound is not None:
+            return bound
+        if (not self.uid and not self._restore_uid()) or self.wire != 'json':
+            return functools.partial(self.jsonrpc_execute, model, method)
+        
+        # Encode the envelope with an empty args list and cut it off just before that list
+        head = _json_encode({
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": self._execute_kw_params(model, method, ())
+        })
+        head = head[:head.rindex(b"[")]
+        post, url, ids, logger, compress = (
+            self._session.post, self.jsonrpc_url, self._id_counter, self.logger, self._compress
+        )
+        mutating = method in _MUTATING_METHODS
+        
+        def call(*args):
+            try:
+                if mutating:
+                    self._invalidate_searches(method)
+                body, headers = compress(b'%s%s]},"id":%d}' % (head, _json_encode(args), next(ids)))
+                response = post(url, data=body, headers=headers)
+                if response.status_code != 200:
+                    logger.error("JSON-RPC execution failed with status code: %s", response.status_code)
+                    return None
+                result = _json_decode(response.content)
+                if 'error' in result:
+                    if self._drop_stale_uid(result['error']):
+                        return self.jsonrpc_execute(model, method, *args)
+                    logger.error("JSON-RPC execution error: %s", result['error'])
+                    return None
+                return result.get('result')
+            except Exception as e:
+                logger.error("JSON-RPC execution error: %s", e)
+                return None
+        
+        self._bound[(model, method)] = call
+        return call
+    
+    def _choose_transport(self, args: tuple) -> str:
+        """
+        Pick the RPC transport for a call based on its payload size.
+        
+        XML-RPC is larger on the wire and slower to parse, so payloads above
+        JSONRPC_PAYLOAD_THRESHOLD (or every payload when prefer_jsonrpc is set)
+        go over JSON-RPC; small ones keep using XML-RPC.
+        
+        Args:
+            args (tuple): Arguments for the method
+            
+        Returns:
+            str: 'jsonrpc' or 'xmlrpc'
+        """
+        if self.prefer_jsonrpc or len(_json_encode(args)) > JSONRPC_PAYLOAD_THRESHOLD:
+            return 'jsonrpc'
+        return 'xmlrpc'
+    
+    def _execute(self, model: str, method: str, *args, raise_fault: bool = False) -> Any:
+        """
+        Execute a method on a model over whichever transport suits the payload.
+        
+        Args:
+            model (str): The model name
+            method (str): The method to execute
+            *args: Additional arguments for the method
+            raise_fault (bool): Raise server faults instead of returning None
+            
+        Returns:
+            Any: Result of the method execution
+            
+        Raises:
+            xmlrpc.client.Fault: If raise_fault is set and the server rejected the call
+        """
+        transport = self._choose_transport(args)
+        self.logger.debug("Executing %s.%s via %s", model, method, transport)
+        if transport == 'jsonrpc':
+            return self.jsonrpc_execute(model, method, *args, raise_fault=raise_fault)
+        return self.xmlrpc_execute(model, method, *args, raise_fault=raise_fault)
+    
+    def _jsonrpc_iter_result(self, model: str, method: str, *args) -> Iterator[Any]:
+        """
+        Execute a method using JSON-RPC and yield the items of its list result as they arrive.
+        
+        The response body is parsed incrementally, so the full result set is
+        never held in memory. A JSON-RPC error response is logged and yields
+        no items; if it rejects a cached uid the call is retried after
+        re-authenticating.
+        
+        Args:
+            model (str): The model name
+            method (str): The method to execute
+            *args: Additional arguments for the method
+            
+        Returns:
+            Iterator[Any]: Items of the result list
+        """
+        if not self.uid and not self._restore_uid():
+            if not self.jsonrpc_authenticate():
+                return
+        
+        body = self._jsonrpc_body(self._execute_kw_params(model, method, args))
+        with self._session.post(self.jsonrpc_url, data=body, stream=True) as response:
+            if response.status_code != 200:
+                self.logger.error("JSON-RPC execution failed with status code: %s", response.status_code)
+                return
+            # Have urllib3 undo any gzip/deflate encoding before ijson reads the raw stream
+            response.raw.decode_content = True
+            events = ijson.parse(response.raw, use_float=True)
+            # Peek at the top-level key to tell a result from an error before streaming
+            for prefix, event, value in events:
+                if prefix == '' and event == 'map_key' and value in ('result', 'error'):
+                    break
+            else:
+                self.logger.error("JSON-RPC response has neither result nor error")
+                return
+            if value == 'result':
+                yield from ijson.items(events, 'result.item')
+                return
+            error = next(ijson.items(events, 'error'), None)
+        
+        if self._drop_stale_uid(error):
+            yield from self._jsonrpc_iter_result(model, method, *args)
+        else:
+            self.logger.error("JSON-RPC execution error: %s", error)
+    
+    # CRUD Operations for CRM Leads
+    
+    def create_lead_xmlrpc(self, lead_data: Dict[str, Any]) -> int:
+        """
+        Create a new lead using XML-RPC.
+        
+        Args:
+            lead_data (Dict[str, Any]): Lead data dictionary
+            
+        Returns:
+            int: ID of the created lead or None if failed
+        """
+        try:
+            self.logger.info("Creating lead via XML-RPC...")
+            lead_id = self.xmlrpc_execute('crm.lead', 'create', lead_data)
+            if lead_id:
+                self.logger.info("Lead created successfully with ID: %s", lead_id)
+            return lead_id
+        except Exception as e:
+            self.logger.error("Error creating lead via XML-RPC: %s", e)
+            return None
+    
+    def create_lead_jsonrpc(self, lead_data: Dict[str, Any]) -> int:
+        """
+        Create a new lead using JSON-RPC.
+        
+        Args:
+            lead_data (Dict[str, Any]): Lead data dictionary
+            
+        Returns:
+            int: ID of the created lead or None if failed
+        """
+        try:
+            self.logger.info("Creating lead via JSON-RPC...")
+            lead_id = self._bind('crm.lead', 'create')(lead_data)
+            if lead_id:
+                self.logger.info("Lead created successfully with ID: %s", lead_id)
+            return lead_id
+        except Exception as e:
+            self.logger.error("Error creating lead via JSON-RPC: %s", e)
+            return None
+    
+    def read_lead_xmlrpc(self, lead_id: int, fields: List[str] = None) -> Dict[str, Any]:
+        """
+        Read a lead using XML-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to read
+            fields (List[str], optional): List of fields to read. Defaults to None (all fields).
+            
+        Returns:
+            Dict[str, Any]: Lead data or None if failed
+        """
+        try:
+            self.logger.info("Reading lead %s via XML-RPC...", lead_id)
+            if fields is None:
+                fields = []
+            lead_data = self.xmlrpc_execute('crm.lead', 'read', [lead_id], {'fields': fields})
+            if lead_data and len(lead_data) > 0:
+                self.logger.info("Lead %s read successfully", lead_id)
+                return lead_data[0]
+            else:
+                self.logger.warning("Lead %s not found", lead_id)
+                return None
+        except Exception as e:
+            self.logger.error("Error reading lead %s via XML-RPC: %s", lead_id, e)
+            return None
+    
+    def read_lead_jsonrpc(self, lead_id: int, fields: List[str] = None) -> Dict[str, Any]:
+        """
+        Read a lead using JSON-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to read
+            fields (List[str], optional): List of fields to read. Defaults to None (all fields).
+            
+        Returns:
+            Dict[str, Any]: Lead data or None if failed
+        """
+        try:
+            self.logger.info("Reading lead %s via JSON-RPC...", lead_id)
+            if fields is None:
+                fields = []
+            lead_data = self._bind('crm.lead', 'read')([lead_id], {'fields': fields})
+            if lead_data and len(lead_data) > 0:
+                self.logger.info("Lead %s read successfully", lead_id)
+                return lead_data[0]
+            else:
+                self.logger.warning("Lead %s not found", lead_id)
+                return None
+        except Exception as e:
+            self.logger.error("Error reading lead %s via JSON-RPC: %s", lead_id, e)
+            return None
+    
+    def update_lead_xmlrpc(self, lead_id: int, lead_data: Dict[str, Any]) -> bool:
+        """
+        Update a lead using XML-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to update
+            lead_data (Dict[str, Any]): Updated lead data
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.logger.info("Updating lead %s via XML-RPC...", lead_id)
+            result = self.xmlrpc_execute('crm.lead', 'write', [lead_id], lead_data)
+            if result:
+                self.logger.info("Lead %s updated successfully", lead_id)
+            else:
+                self.logger.warning("Failed to update lead %s", lead_id)
+            return result
+        except Exception as e:
+            self.logger.error("Error updating lead %s via XML-RPC: %s", lead_id, e)
+            return False
+    
+    def update_lead_jsonrpc(self, lead_id: int, lead_data: Dict[str, Any]) -> bool:
+        """
+        Update a lead using JSON-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to update
+            lead_data (Dict[str, Any]): Updated lead data
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.logger.info("Updating lead %s via JSON-RPC...", lead_id)
+            result = self._bind('crm.lead', 'write')([lead_id], lead_data)
+            if result:
+                self.logger.info("Lead %s updated successfully", lead_id)
+            else:
+                self.logger.warning("Failed to update lead %s", lead_id)
+            return result
+        except Exception as e:
+            self.logger.error("Error updating lead %s via JSON-RPC: %s", lead_id, e)
+            return False
+    
+    def update_and_read_lead_jsonrpc(self, lead_id: int, lead_data: Dict[str, Any],
+                                     fields: List[str]) -> Dict[str, Any]:
+        """
+        Update a lead and read it back in one JSON-RPC round trip.
+        
+        Uses web_save (Odoo 17+), which writes and returns the requested fields.
+        On servers without it this falls back to a write followed by a read;
+        only a "method does not exist" fault switches the fallback on for good.
+        
+        Args:
+            lead_id (int): ID of the lead to update
+            lead_data (Dict[str, Any]): Updated lead data
+            fields (List[str]): Fields to read back
+            
+        Returns:
+            Dict[str, Any]: Updated lead data or None if failed
+        """
+        try:
+            if self._has_web_save:
+                self.logger.info("Updating and reading lead %s via JSON-RPC web_save...", lead_id)
+                try:
+                    saved = self.jsonrpc_execute(
+                        'crm.lead', 'web_save', [lead_id], lead_data, {f: {} for f in fields}, raise_fault=True
+                    )
+                except xmlrpc.client.Fault as e:
+                    if 'does not exist' not in e.faultString:
+                        self.logger.error("JSON-RPC execution error: %s", e.faultString)
+                        return None
+                    self.logger.warning("web_save unavailable, falling back to write and read")
+                    self._has_web_save = False
+                else:
+                    if saved:
+                        self.logger.info("Lead %s updated successfully", lead_id)
+                        return saved[0]
+                    self.logger.warning("Failed to update lead %s", lead_id)
+                    return None
+            
+            if self.update_lead_jsonrpc(lead_id, lead_data):
+                return self.read_lead_jsonrpc(lead_id, fields)
+            return None
+        except Exception as e:
+            self.logger.error("Error updating lead %s via JSON-RPC: %s", lead_id, e)
+            return None
+    
+    def delete_lead_xmlrpc(self, lead_id: int) -> bool:
+        """
+        Delete a lead using XML-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to delete
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.logger.info("Deleting lead %s via XML-RPC...", lead_id)
+            result = self.xmlrpc_execute('crm.lead', 'unlink', [lead_id])
+            if result:
+                self.logger.info("Lead %s deleted successfully", lead_id)
             else:
-                self.logger.warning(f"Failed to delete lead {lead_id}")
+                self.logger.warning("Failed to delete lead %s", lead_id)
             return result
         except Exception as e:
-            self.logger.error(f"Error deleting lead {lead_id} via XML-RPC: {str(e)}")
+            self.logger.error("Error deleting lead %s via XML-RPC: %s", lead_id, e)
             return False
     
     def delete_lead_jsonrpc(self, lead_id: int) -> bool:
@@ -390,15 +1243,15 @@ class OdooAPI:
             bool: True if successful, False otherwise
         """
         try:
-            self.logger.info(f"Deleting lead {lead_id} via JSON-RPC...")
-            result = self.jsonrpc_execute('crm.lead', 'unlink', [lead_id])
+            self.logger.info("Deleting lead %s via JSON-RPC...", lead_id)
+            result = self._bind('crm.lead', 'unlink')([lead_id])
             if result:
-                self.logger.info(f"Lead {lead_id} deleted successfully")
+                self.logger.info("Lead %s deleted successfully", lead_id)
             else:
-                self.logger.warning(f"Failed to delete lead {lead_id}")
+                self.logger.warning("Failed to delete lead %s", lead_id)
             return result
         except Exception as e:
-            self.logger.error(f"Error deleting lead {lead_id} via JSON-RPC: {str(e)}")
+            self.logger.error("Error deleting lead %s via JSON-RPC: %s", lead_id, e)
             return False
     
     # Search and Filter Operations
@@ -417,7 +1270,7 @@ class OdooAPI:
             List[int]: List of lead IDs or empty list if failed
         """
         try:
-            self.logger.info(f"Searching leads via XML-RPC with domain: {domain}")
+            self.logger.info("Searching leads via XML-RPC with domain: %s", domain)
             kwargs = {}
             if offset:
                 kwargs['offset'] = offset
@@ -427,10 +1280,10 @@ class OdooAPI:
                 kwargs['order'] = order
                 
             lead_ids = self.xmlrpc_execute('crm.lead', 'search', domain, kwargs)
-            self.logger.info(f"Found {len(lead_ids)} leads")
+            self.logger.info("Found %s leads", len(lead_ids))
             return lead_ids
         except Exception as e:
-            self.logger.error(f"Error searching leads via XML-RPC: {str(e)}")
+            self.logger.error("Error searching leads via XML-RPC: %s", e)
             return []
     
     def search_leads_jsonrpc(self, domain: List, offset: int = 0, limit: int = None, order: str = None) -> List[int]:
@@ -447,7 +1300,7 @@ class OdooAPI:
             List[int]: List of lead IDs or empty list if failed
         """
         try:
-            self.logger.info(f"Searching leads via JSON-RPC with domain: {domain}")
+            self.logger.info("Searching leads via JSON-RPC with domain: %s", domain)
             kwargs = {}
             if offset:
                 kwargs['offset'] = offset
@@ -456,11 +1309,11 @@ class OdooAPI:
             if order:
                 kwargs['order'] = order
                 
-            lead_ids = self.jsonrpc_execute('crm.lead', 'search', domain, kwargs)
-            self.logger.info(f"Found {len(lead_ids)} leads")
+            lead_ids = self._bind('crm.lead', 'search')(domain, kwargs)
+            self.logger.info("Found %s leads", len(lead_ids))
             return lead_ids
         except Exception as e:
-            self.logger.error(f"Error searching leads via JSON-RPC: {str(e)}")
+            self.logger.error("Error searching leads via JSON-RPC: %s", e)
             return []
     
     def search_read_leads_xmlrpc(self, domain: List, fields: List[str] = None, 
@@ -479,7 +1332,7 @@ class OdooAPI:
             List[Dict[str, Any]]: List of lead data dictionaries or empty list if failed
         """
         try:
-            self.logger.info(f"Search-reading leads via XML-RPC with domain: {domain}")
+            self.logger.info("Search-reading leads via XML-RPC with domain: %s", domain)
             if fields is None:
                 fields = []
                 
@@ -494,10 +1347,10 @@ class OdooAPI:
                 kwargs['order'] = order
                 
             leads = self.xmlrpc_execute('crm.lead', 'search_read', domain, kwargs)
-            self.logger.info(f"Found and read {len(leads)} leads")
+            self.logger.info("Found and read %s leads", len(leads))
             return leads
         except Exception as e:
-            self.logger.error(f"Error search-reading leads via XML-RPC: {str(e)}")
+            self.logger.error("Error search-reading leads via XML-RPC: %s", e)
             return []
     
     def search_read_leads_jsonrpc(self, domain: List, fields: List[str] = None, 
@@ -516,7 +1369,7 @@ class OdooAPI:
             List[Dict[str, Any]]: List of lead data dictionaries or empty list if failed
         """
         try:
-            self.logger.info(f"Search-reading leads via JSON-RPC with domain: {domain}")
+            self.logger.info("Search-reading leads via JSON-RPC with domain: %s", domain)
             if fields is None:
                 fields = []
                 
@@ -529,45 +1382,219 @@ class OdooAPI:
                 kwargs['limit'] = limit
             if order:
                 kwargs['order'] = order
+            
+            key = (_json_encode(domain), tuple(fields), offset, limit, order)
+            leads = self._cached_search(key)
+            if leads is not None:
+                self.logger.info("Found and read %s leads (cached)", len(leads))
+                return leads
                 
-            leads = self.jsonrpc_execute('crm.lead', 'search_read', domain, kwargs)
-            self.logger.info(f"Found and read {len(leads)} leads")
+            generation = self._search_generation
+            leads = self._bind('crm.lead', 'search_read')(domain, kwargs)
+            self.logger.info("Found and read %s leads", len(leads))
+            self._store_search(key, generation, leads)
             return leads
         except Exception as e:
-            self.logger.error(f"Error search-reading leads via JSON-RPC: {str(e)}")
+            self.logger.error("Error search-reading leads via JSON-RPC: %s", e)
             return []
     
-    # Batch Operations
-    
-    def create_leads_batch_xmlrpc(self, leads_data: List[Dict[str, Any]]) -> List[int]:
+    def isearch_read_leads_jsonrpc(self, domain: List, fields: List[str] = None,
+                                   offset: int = 0, limit: int = None, order: str = None) -> Iterator[Dict[str, Any]]:
         """
-        Create multiple leads in batch using XML-RPC.
+        Search and read leads using JSON-RPC, yielding each lead as it is parsed.
+        
+        Unlike search_read_leads_jsonrpc this streams the response, so memory
+        stays flat for large result sets. Falls back to the buffered call when
+        ijson is not installed.
         
         Args:
-            leads_data (List[Dict[str, Any]]): List of lead data dictionaries
+            domain (List): Search domain
+            fields (List[str], optional): Fields to read. Defaults to None (all fields).
+            offset (int, optional): Result offset. Defaults to 0.
+            limit (int, optional): Maximum number of records. Defaults to None.
+            order (str, optional): Sort order. Defaults to None.
             
         Returns:
-            List[int]: List of created lead IDs or empty list if failed
+            Iterator[Dict[str, Any]]: Lead data dictionaries
         """
+        if ijson is None:
+            yield from self.search_read_leads_jsonrpc(domain, fields, offset, limit, order)
+            return
+        
         try:
-            self.logger.info(f"Creating {len(leads_data)} leads in batch via XML-RPC...")
-            lead_ids = []
-            
-            for lead_data in leads_data:
-                lead_id = self.create_lead_xmlrpc(lead_data)
-                if lead_id:
-                    lead_ids.append(lead_id)
-            
-            self.logger.info(f"Successfully created {len(lead_ids)} leads in batch")
-            return lead_ids
+            self.logger.info("Streaming search-read of leads via JSON-RPC with domain: %s", domain)
+            if fields is None:
+                fields = []
+                
+            kwargs = {
+                'fields': fields
+            }
+            if offset:
+                kwargs['offset'] = offset
+            if limit:
+                kwargs['limit'] = limit
+            if order:
+                kwargs['order'] = order
+                
+            yield from self._jsonrpc_iter_result('crm.lead', 'search_read', domain, kwargs)
         except Exception as e:
-            self.logger.error(f"Error creating leads in batch via XML-RPC: {str(e)}")
-            return []
+            self.logger.error("Error streaming search-read of leads via JSON-RPC: %s", e)
+    
+    def _lead_field_types(self, fields: List[str]) -> Dict[str, str]:
+        """
+        Get the Odoo field types of crm.lead fields, cached per field list.
+        
+        Only a successful fields_get is cached, so a failed call is retried
+        next time instead of typing every column as 'char' for good.
+        
+        Args:
+            fields (List[str]): Field names
+            
+        Returns:
+            Dict[str, str]: Field name to Odoo type ('char', 'many2one', ...) or None if failed
+        """
+        key = tuple(fields)
+        types = self._column_types.get(key)
+        if types is None:
+            info = self._bind('crm.lead', 'fields_get')(list(fields), ['type'])
+            if info is None:
+                return None
+            types = {f: info.get(f, {}).get('type', 'char') for f in fields}
+            self._column_types[key] = types
+        return types
+    
+    def search_read_leads_columnar(self, domain: List, fields: List[str],
+                                   offset: int = 0, limit: int = None, order: str = None) -> Any:
+        """
+        Search and read leads via JSON-RPC into a column-oriented result.
+        
+        Odoo's False placeholders become None (except on boolean fields),
+        many2one pairs become their id and x2many fields stay id lists. The
+        field types come from fields_get once per field list, so the Arrow
+        schema is never inferred from the data.
+        
+        Args:
+            domain (List): Search domain
+            fields (List[str]): Fields to read
+            offset (int, optional): Result offset. Defaults to 0.
+            limit (int, optional): Maximum number of records. Defaults to None.
+            order (str, optional): Sort order. Defaults to None.
+            
+        Returns:
+            Any: pyarrow.Table if pyarrow is installed, otherwise a dict of field name
+                to value list; None if failed
+        """
+        try:
+            fields = list(fields)
+            if 'id' not in fields:
+                fields.insert(0, 'id')
+            types = self._lead_field_types(fields)
+            if types is None:
+                self.logger.error("Could not get crm.lead field types for columnar search-read")
+                return None
+            kwargs = {'fields': fields}
+            if offset:
+                kwargs['offset'] = offset
+            if limit:
+                kwargs['limit'] = limit
+            if order:
+                kwargs['order'] = order
+            # Called directly so a failed search is None, not an empty result
+            rows = self._bind('crm.lead', 'search_read')(domain, kwargs)
+            if rows is None:
+                self.logger.error("Columnar search-read of leads failed")
+                return None
+            
+            columns = {}
+            for field in fields:
+                values = [row.get(field) for row in rows]
+                kind = types[field]
+                if kind == 'many2one':
+                    values = [v[0] if v else None for v in values]
+                elif kind not in ('boolean', 'one2many', 'many2many'):
+                    values = [None if v is False else v for v in values]
+                columns[field] = values
+            
+            if pa is None:
+                return columns
+            schema = self._arrow_schemas.get(tuple(fields))
+            if schema is None:
+                arrow_types = {
+                    'integer': pa.int64(), 'many2one': pa.int64(), 'float': pa.float64(),
+                    'monetary': pa.float64(), 'boolean': pa.bool_(),
+                    'one2many': pa.list_(pa.int64()), 'many2many': pa.list_(pa.int64()),
+                }
+                schema = pa.schema([(f, arrow_types.get(types[f], pa.string())) for f in fields])
+                self._arrow_schemas[tuple(fields)] = schema
+            return pa.Table.from_pydict(columns, schema=schema)
+        except Exception as e:
+            self.logger.error("Error search-reading leads into columns via JSON-RPC: %s", e)
+            return None
+    
+    # Batch Operations
+    
+    @staticmethod
+    def _group_updates(leads_updates: Dict[int, Dict[str, Any]]) -> List[Tuple[Dict[str, Any], List[int]]]:
+        """
+        Group lead IDs that share identical update values so each group needs one write.
+        
+        Args:
+            leads_updates (Dict[int, Dict[str, Any]]): Dictionary mapping lead IDs to update data
+            
+        Returns:
+            List[Tuple[Dict[str, Any], List[int]]]: (update data, lead IDs) pairs
+        """
+        groups = {}
+        for lead_id, update_data in leads_updates.items():
+            key = json.dumps(update_data, sort_keys=True, default=str)
+            groups.setdefault(key, (update_data, []))[1].append(lead_id)
+        return list(groups.values())
+    
+    def create_leads_batch_xmlrpc(self, leads_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create multiple leads in batch using XML-RPC.
+        
+        A single multi-record create is tried first; if the server rejects it
+        the leads are created one by one so partial success is still reported
+        accurately. A create lost to a timeout or dropped connection is not
+        retried, since the server may already have committed it.
+        
+        Args:
+            leads_data (List[Dict[str, Any]]): List of lead data dictionaries
+            
+        Returns:
+            List[int]: List of created lead IDs or empty list if failed
+        """
+        try:
+            self.logger.debug("Creating %s leads in batch via XML-RPC...", len(leads_data))
+            if not leads_data:
+                return []
+            
+            # Large batches are routed over JSON-RPC by payload size
+            try:
+                lead_ids = self._execute('crm.lead', 'create', list(leads_data), raise_fault=True) or []
+            except xmlrpc.client.Fault as e:
+                self.logger.warning("Bulk create rejected (%s), falling back to per-record creates", e.faultString)
+                def create_one(lead_data):
+                    lead_id = self.xmlrpc_execute('crm.lead', 'create', lead_data)
+                    self.logger.debug("Lead created with ID: %s", lead_id)
+                    return lead_id
+                lead_ids = [lead_id for lead_id in self._map(create_one, leads_data) if lead_id]
+            
+            self.logger.info("Successfully created %s leads in batch", len(lead_ids))
+            return lead_ids
+        except Exception as e:
+            self.logger.error("Error creating leads in batch via XML-RPC: %s", e)
+            return []
     
     def create_leads_batch_jsonrpc(self, leads_data: List[Dict[str, Any]]) -> List[int]:
         """
         Create multiple leads in batch using JSON-RPC.
         
+        Synchronous counterpart of acreate_leads_batch_jsonrpc over the pooled
+        session: a single multi-record create is tried first; if the server
+        rejects it the leads are created one by one on a thread pool.
+        
         Args:
             leads_data (List[Dict[str, Any]]): List of lead data dictionaries
             
@@ -575,24 +1602,30 @@ class OdooAPI:
             List[int]: List of created lead IDs or empty list if failed
         """
         try:
-            self.logger.info(f"Creating {len(leads_data)} leads in batch via JSON-RPC...")
-            lead_ids = []
+            self.logger.debug("Creating %s leads in batch via JSON-RPC...", len(leads_data))
+            if not leads_data:
+                return []
             
-            for lead_data in leads_data:
-                lead_id = self.create_lead_jsonrpc(lead_data)
-                if lead_id:
-                    lead_ids.append(lead_id)
+            try:
+                lead_ids = self.jsonrpc_execute('crm.lead', 'create', list(leads_data), raise_fault=True) or []
+            except xmlrpc.client.Fault as e:
+                self.logger.warning("Bulk create rejected (%s), falling back to per-record creates", e.faultString)
+                create_one = self._bind('crm.lead', 'create')
+                lead_ids = [lead_id for lead_id in self._map(create_one, leads_data) if lead_id]
             
-            self.logger.info(f"Successfully created {len(lead_ids)} leads in batch")
+            self.logger.info("Successfully created %s leads in batch", len(lead_ids))
             return lead_ids
         except Exception as e:
-            self.logger.error(f"Error creating leads in batch via JSON-RPC: {str(e)}")
+            self.logger.error("Error creating leads in batch via JSON-RPC: %s", e)
             return []
     
     def update_leads_batch_xmlrpc(self, leads_updates: Dict[int, Dict[str, Any]]) -> Dict[int, bool]:
         """
         Update multiple leads in batch using XML-RPC.
         
+        Leads sharing the same update data are written with one call per group;
+        a group whose write fails is retried record by record.
+        
         Args:
             leads_updates (Dict[int, Dict[str, Any]]): Dictionary mapping lead IDs to update data
             
@@ -600,24 +1633,39 @@ class OdooAPI:
             Dict[int, bool]: Dictionary mapping lead IDs to update success status
         """
         try:
-            self.logger.info(f"Updating {len(leads_updates)} leads in batch via XML-RPC...")
+            self.logger.debug("Updating %s leads in batch via XML-RPC...", len(leads_updates))
             results = {}
+            retries = []
+            
+            for update_data, lead_ids in self._group_updates(leads_updates):
+                if self.xmlrpc_execute('crm.lead', 'write', lead_ids, update_data):
+                    results.update(dict.fromkeys(lead_ids, True))
+                else:
+                    retries.extend((lead_id, update_data) for lead_id in lead_ids)
             
-            for lead_id, update_data in leads_updates.items():
-                success = self.update_lead_xmlrpc(lead_id, update_data)
-                results[lead_id] = success
+            def update_one(retry):
+                lead_id, update_data = retry
+                ok = bool(self.xmlrpc_execute('crm.lead', 'write', [lead_id], update_data))
+                self.logger.debug("Lead %s updated: %s", lead_id, ok)
+                return ok
+            if retries:
+                results.update(zip((lead_id for lead_id, _ in retries), self._map(update_one, retries)))
             
             success_count = sum(1 for success in results.values() if success)
-            self.logger.info(f"Successfully updated {success_count} out of {len(leads_updates)} leads in batch")
+            self.logger.info("Successfully updated %s out of %s leads in batch", success_count, len(leads_updates))
             return results
         except Exception as e:
-            self.logger.error(f"Error updating leads in batch via XML-RPC: {str(e)}")
+            self.logger.error("Error updating leads in batch via XML-RPC: %s", e)
             return {}
     
     def update_leads_batch_jsonrpc(self, leads_updates: Dict[int, Dict[str, Any]]) -> Dict[int, bool]:
         """
         Update multiple leads in batch using JSON-RPC.
         
+        Synchronous counterpart of aupdate_leads_batch_jsonrpc over the pooled
+        session: leads sharing the same update data are written with one call
+        per group; a group whose write fails is retried record by record.
+        
         Args:
             leads_updates (Dict[int, Dict[str, Any]]): Dictionary mapping lead IDs to update data
             
@@ -625,24 +1673,64 @@ class OdooAPI:
             Dict[int, bool]: Dictionary mapping lead IDs to update success status
         """
         try:
-            self.logger.info(f"Updating {len(leads_updates)} leads in batch via JSON-RPC...")
+            self.logger.debug("Updating %s leads in batch via JSON-RPC...", len(leads_updates))
             results = {}
+            retries = []
+            write = self._bind('crm.lead', 'write')
+            
+            for update_data, lead_ids in self._group_updates(leads_updates):
+                if write(lead_ids, update_data):
+                    results.update(dict.fromkeys(lead_ids, True))
+                else:
+                    retries.extend((lead_id, update_data) for lead_id in lead_ids)
             
-            for lead_id, update_data in leads_updates.items():
-                success = self.update_lead_jsonrpc(lead_id, update_data)
-                results[lead_id] = success
+            def update_one(retry):
+                lead_id, update_data = retry
+                ok = bool(write([lead_id], update_data))
+                self.logger.debug("Lead %s updated: %s", lead_id, ok)
+                return ok
+            if retries:
+                results.update(zip((lead_id for lead_id, _ in retries), self._map(update_one, retries)))
             
             success_count = sum(1 for success in results.values() if success)
-            self.logger.info(f"Successfully updated {success_count} out of {len(leads_updates)} leads in batch")
+            self.logger.info("Successfully updated %s out of %s leads in batch", success_count, len(leads_updates))
             return results
         except Exception as e:
-            self.logger.error(f"Error updating leads in batch via JSON-RPC: {str(e)}")
+            self.logger.error("Error updating leads in batch via JSON-RPC: %s", e)
             return {}
     
+    def update_leads_uniform_xmlrpc(self, lead_ids: List[int], update_data: Dict[str, Any]) -> bool:
+        """
+        Apply the same update to multiple leads with a single XML-RPC write.
+        
+        Args:
+            lead_ids (List[int]): IDs of the leads to update
+            update_data (Dict[str, Any]): Update data applied to every lead
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            lead_ids = list(lead_ids)
+            if not lead_ids:
+                return True
+            result = self._execute('crm.lead', 'write', lead_ids, update_data)
+            if result:
+                self.logger.info("Updated %s leads with one write", len(lead_ids))
+            else:
+                self.logger.warning("Failed to update %s leads", len(lead_ids))
+            return bool(result)
+        except Exception as e:
+            self.logger.error("Error updating leads via XML-RPC: %s", e)
+            return False
+    
     def delete_leads_batch_xmlrpc(self, lead_ids: List[int]) -> Dict[int, bool]:
         """
         Delete multiple leads in batch using XML-RPC.
         
+        All leads are unlinked with one call; if that fails they are deleted
+        one by one so partial success is still reported accurately.
+        
         Args:
             lead_ids (List[int]): List of lead IDs to delete
             
@@ -650,24 +1738,96 @@ class OdooAPI:
             Dict[int, bool]: Dictionary mapping lead IDs to deletion success status
         """
         try:
-            self.logger.info(f"Deleting {len(lead_ids)} leads in batch via XML-RPC...")
-            results = {}
+            self.logger.debug("Deleting %s leads in batch via XML-RPC...", len(lead_ids))
+            lead_ids = list(lead_ids)
             
-            for lead_id in lead_ids:
-                success = self.delete_lead_xmlrpc(lead_id)
-                results[lead_id] = success
+            if lead_ids and self.xmlrpc_execute('crm.lead', 'unlink', lead_ids):
+                results = dict.fromkeys(lead_ids, True)
+            else:
+                def delete_one(lead_id):
+                    ok = bool(self.xmlrpc_execute('crm.lead', 'unlink', [lead_id]))
+                    self.logger.debug("Lead %s deleted: %s", lead_id, ok)
+                    return ok
+                results = dict(zip(lead_ids, self._map(delete_one, lead_ids)))
             
             success_count = sum(1 for success in results.values() if success)
-            self.logger.info(f"Successfully deleted {success_count} out of {len(lead_ids)} leads in batch")
+            self.logger.info("Successfully deleted %s out of %s leads in batch", success_count, len(lead_ids))
             return results
         except Exception as e:
-            self.logger.error(f"Error deleting leads in batch via XML-RPC: {str(e)}")
+            self.logger.error("Error deleting leads in batch via XML-RPC: %s", e)
             return {}
     
+    def call_batch_jsonrpc(self, calls: List[Tuple[str, str, tuple]]) -> List[Any]:
+        """
+        Execute several calls in one JSON-RPC batch request.
+        
+        Synchronous counterpart of acall_batch_jsonrpc over the pooled session.
+        When the server rejects batch requests the calls are sent one by one,
+        in order, so queued writes are still applied in sequence.
+        
+        Args:
+            calls (List[Tuple[str, str, tuple]]): (model, method, args) for each call
+            
+        Returns:
+            List[Any]: Result of each call in order, None for calls that failed
+        """
+        if not calls:
+            return []
+        try:
+            for _, method, _ in calls:
+                self._invalidate_searches(method)
+            if not self.uid and not self._restore_uid():
+                if not self.jsonrpc_authenticate():
+                    return [None] * len(calls)
+            
+            if self._has_jsonrpc_batch and self.wire == 'json':
+                ids, body = self._batch_body(calls)
+                body, headers = self._compress(body)
+                response = self._session.post(self.jsonrpc_url, data=body, headers=headers)
+                if 400 <= response.status_code < 500:
+                    # Odoo 16+ rejects a JSON array with 400 "Invalid JSON-RPC data"
+                    replies = None
+                elif response.status_code != 200:
+                    # Likely transient (e.g. a proxy 502), so batching stays enabled
+                    self.logger.error("JSON-RPC batch failed with status code: %s", response.status_code)
+                    return [None] * len(calls)
+                else:
+                    replies = _json_decode(response.content)
+                
+                if isinstance(replies, list):
+                    if any(self._drop_stale_uid(reply['error']) for reply in replies if 'error' in reply):
+                        return self.call_batch_jsonrpc(calls)
+                    return self._batch_results(ids, replies)
+                if replies is not None and not (isinstance(replies, dict) and 'error' in replies):
+                    self.logger.error("Unexpected JSON-RPC batch reply: %s", replies)
+                    return [None] * len(calls)
+                # A 4xx reply, or a single error object from older servers, means
+                # the endpoint does not accept batch arrays
+                self.logger.warning("JSON-RPC batch requests not supported, sending calls individually")
+                self._has_jsonrpc_batch = False
+            
+            return [self.jsonrpc_execute(model, method, *args) for model, method, args in calls]
+        except Exception as e:
+            self.logger.error("Error executing JSON-RPC batch: %s", e)
+            return [None] * len(calls)
+    
+    def batch(self) -> 'RPCBatch':
+        """
+        Start a batch that queues calls and sends them together.
+        
+        Returns:
+            RPCBatch: Context manager that flushes the queued calls on exit
+        """
+        return RPCBatch(self)
+    
     def delete_leads_batch_jsonrpc(self, lead_ids: List[int]) -> Dict[int, bool]:
         """
         Delete multiple leads in batch using JSON-RPC.
         
+        Synchronous counterpart of adelete_leads_batch_jsonrpc over the pooled
+        session: all leads are unlinked with one call; if that fails they are
+        deleted one by one on a thread pool.
+        
         Args:
             lead_ids (List[int]): List of lead IDs to delete
             
@@ -675,220 +1835,769 @@ class OdooAPI:
             Dict[int, bool]: Dictionary mapping lead IDs to deletion success status
         """
         try:
-            self.logger.info(f"Deleting {len(lead_ids)} leads in batch via JSON-RPC...")
+            self.logger.debug("Deleting %s leads in batch via JSON-RPC...", len(lead_ids))
+            lead_ids = list(lead_ids)
+            unlink = self._bind('crm.lead', 'unlink')
+            
+            if lead_ids and unlink(lead_ids):
+                results = dict.fromkeys(lead_ids, True)
+            else:
+                def delete_one(lead_id):
+                    ok = bool(unlink([lead_id]))
+                    self.logger.debug("Lead %s deleted: %s", lead_id, ok)
+                    return ok
+                results = dict(zip(lead_ids, self._map(delete_one, lead_ids)))
+            
+            success_count = sum(1 for success in results.values() if success)
+            self.logger.info("Successfully deleted %s out of %s leads in batch", success_count, len(lead_ids))
+            return results
+        except Exception as e:
+            self.logger.error("Error deleting leads in batch via JSON-RPC: %s", e)
+            return {}
+    
+    def unlink_leads_jsonrpc(self, lead_ids: List[int]) -> bool:
+        """
+        Delete multiple leads with a single JSON-RPC unlink.
+        
+        Synchronous counterpart of aunlink_leads_jsonrpc; there is no
+        per-record fallback, Odoo deletes all of the leads or none of them.
+        
+        Args:
+            lead_ids (List[int]): List of lead IDs to delete
+            
+        Returns:
+            bool: True if all leads were deleted, False otherwise
+        """
+        lead_ids = list(lead_ids)
+        if not lead_ids:
+            return True
+        self.logger.info("Deleting %s leads via JSON-RPC...", len(lead_ids))
+        result = self._bind('crm.lead', 'unlink')(lead_ids)
+        if result:
+            self.logger.info("Deleted %s leads", len(lead_ids))
+        else:
+            self.logger.warning("Failed to delete %s leads", len(lead_ids))
+        return bool(result)
+    
+    # Async JSON-RPC Operations
+    
+    async def _ajsonrpc_request(self, params: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Async counterpart of _jsonrpc_request over the shared aiohttp session.
+        
+        Args:
+            params (Dict[str, Any]): JSON-RPC request params
+            
+        Returns:
+            Tuple[int, Optional[Dict[str, Any]]]: HTTP status code and decoded body (None unless 200)
+        """
+        self._check_wire()
+        session = await self._aio()
+        if self.wire == 'msgpack':
+            async with session.post(
+                self.msgpackrpc_url,
+                data=self._msgpack_body(params),
+                headers={"Content-Type": "application/msgpack"}
+            ) as response:
+                if response.status not in (404, 415):
+                    if response.status != 200:
+                        return response.status, None
+                    return 200, msgpack.unpackb(await response.read(), raw=False, timestamp=3)
+            self.logger.warning("MessagePack RPC endpoint unavailable, falling back to JSON-RPC")
+            self.wire = 'json'
+        
+        body, headers = self._compress(self._jsonrpc_body(params))
+        async with session.post(self.jsonrpc_url, data=body, headers=headers) as response:
+            if response.status != 200:
+                return response.status, None
+            return 200, _json_decode(await response.read())
+    
+    async def _ajsonrpc_execute(self, model: str, method: str, *args, raise_fault: bool = False) -> Any:
+        """
+        Execute a method on a model using JSON-RPC over the shared aiohttp session.
+        
+        Args:
+            model (str): The model name
+            method (str): The method to execute
+            *args: Additional arguments for the method
+            raise_fault (bool): Raise JSON-RPC error replies instead of returning None
+            
+        Returns:
+            Any: Result of the method execution
+            
+        Raises:
+            xmlrpc.client.Fault: If raise_fault is set and the server returned an error
+        """
+        try:
+            self._invalidate_searches(method)
+            if not self.uid and not self._restore_uid():
+                if not await asyncio.to_thread(self.jsonrpc_authenticate):
+                    return None
+            
+            params = self._execute_kw_params(model, method, args)
+            status, result = await self._ajsonrpc_request(params)
+            if status != 200:
+                self.logger.error("JSON-RPC execution failed with status code: %s", status)
+                return None
+            
+            if 'result' in result:
+                return result['result']
+            elif 'error' in result:
+                if self._drop_stale_uid(result['error']):
+                    return await self._ajsonrpc_execute(model, method, *args, raise_fault=raise_fault)
+                if raise_fault:
+                    raise _jsonrpc_fault(result['error'])
+                self.logger.error("JSON-RPC execution error: %s", result['error'])
+                return None
+                
+        except xmlrpc.client.Fault:
+            raise
+        except Exception as e:
+            self.logger.error("JSON-RPC execution error: %s", e)
+            return None
+    
+    async def acreate_lead_jsonrpc(self, lead_data: Dict[str, Any]) -> int:
+        """
+        Create a new lead using async JSON-RPC.
+        
+        Args:
+            lead_data (Dict[str, Any]): Lead data dictionary
+            
+        Returns:
+            int: ID of the created lead or None if failed
+        """
+        self.logger.debug("Creating lead via async JSON-RPC...")
+        lead_id = await self._ajsonrpc_execute('crm.lead', 'create', lead_data)
+        if lead_id:
+            self.logger.debug("Lead created successfully with ID: %s", lead_id)
+        return lead_id
+    
+    async def aupdate_lead_jsonrpc(self, lead_id: int, lead_data: Dict[str, Any]) -> bool:
+        """
+        Update a lead using async JSON-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to update
+            lead_data (Dict[str, Any]): Updated lead data
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.logger.debug("Updating lead %s via async JSON-RPC...", lead_id)
+        result = await self._ajsonrpc_execute('crm.lead', 'write', [lead_id], lead_data)
+        if result:
+            self.logger.debug("Lead %s updated successfully", lead_id)
+        else:
+            self.logger.warning("Failed to update lead %s", lead_id)
+        return bool(result)
+    
+    async def adelete_lead_jsonrpc(self, lead_id: int) -> bool:
+        """
+        Delete a lead using async JSON-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to delete
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.logger.debug("Deleting lead %s via async JSON-RPC...", lead_id)
+        result = await self._ajsonrpc_execute('crm.lead', 'unlink', [lead_id])
+        if result:
+            self.logger.debug("Lead %s deleted successfully", lead_id)
+        else:
+            self.logger.warning("Failed to delete lead %s", lead_id)
+        return bool(result)
+    
+    async def aread_lead_jsonrpc(self, lead_id: int, fields: List[str] = None) -> Dict[str, Any]:
+        """
+        Read a lead using async JSON-RPC.
+        
+        Args:
+            lead_id (int): ID of the lead to read
+            fields (List[str], optional): List of fields to read. Defaults to None (all fields).
+            
+        Returns:
+            Dict[str, Any]: Lead data or None if failed
+        """
+        self.logger.info("Reading lead %s via async JSON-RPC...", lead_id)
+        lead_data = await self._ajsonrpc_execute('crm.lead', 'read', [lead_id], {'fields': fields or []})
+        if lead_data:
+            self.logger.info("Lead %s read successfully", lead_id)
+            return lead_data[0]
+        self.logger.warning("Lead %s not found", lead_id)
+        return None
+    
+    async def asearch_read_leads_jsonrpc(self, domain: List, fields: List[str] = None,
+                                         offset: int = 0, limit: int = None, order: str = None) -> List[Dict[str, Any]]:
+        """
+        Search and read leads in one operation using async JSON-RPC.
+        
+        Args:
+            domain (List): Search domain
+            fields (List[str], optional): Fields to read. Defaults to None (all fields).
+            offset (int, optional): Result offset. Defaults to 0.
+            limit (int, optional): Maximum number of records. Defaults to None.
+            order (str, optional): Sort order. Defaults to None.
+            
+        Returns:
+            List[Dict[str, Any]]: List of lead data dictionaries or empty list if failed
+        """
+        self.logger.info("Search-reading leads via async JSON-RPC with domain: %s", domain)
+        kwargs = {'fields': fields or []}
+        if offset:
+            kwargs['offset'] = offset
+        if limit:
+            kwargs['limit'] = limit
+        if order:
+            kwargs['order'] = order
+        leads = await self._ajsonrpc_execute('crm.lead', 'search_read', domain, kwargs) or []
+        self.logger.info("Found and read %s leads", len(leads))
+        return leads
+    
+    async def acall_batch_jsonrpc(self, calls: List[Tuple[str, str, tuple]]) -> List[Any]:
+        """
+        Execute several independent calls in one JSON-RPC batch request.
+        
+        The calls are posted as one JSON array and the replies matched back
+        by id. Servers that reject batch requests (stock Odoo answers an array
+        with a single error object) get the calls concurrently instead, and
+        are not sent batches again.
+        
+        Args:
+            calls (List[Tuple[str, str, tuple]]): (model, method, args) for each call
+            
+        Returns:
+            List[Any]: Result of each call in order, None for calls that failed
+        """
+        if not calls:
+            return []
+        try:
+            for _, method, _ in calls:
+                self._invalidate_searches(method)
+            if not self.uid and not self._restore_uid():
+                if not await asyncio.to_thread(self.jsonrpc_authenticate):
+                    return [None] * len(calls)
+            
+            if self._has_jsonrpc_batch and self.wire == 'json':
+                ids, body = self._batch_body(calls)
+                body, headers = self._compress(body)
+                session = await self._aio()
+                async with session.post(self.jsonrpc_url, data=body, headers=headers) as response:
+                    if 400 <= response.status < 500:
+                        # Odoo 16+ rejects a JSON array with 400 "Invalid JSON-RPC data"
+                        replies = None
+                    elif response.status != 200:
+                        # Likely transient (e.g. a proxy 502), so batching stays enabled
+                        self.logger.error("JSON-RPC batch failed with status code: %s", response.status)
+                        return [None] * len(calls)
+                    else:
+                        replies = _json_decode(await response.read())
+                
+                if isinstance(replies, list):
+                    if any(self._drop_stale_uid(reply['error']) for reply in replies if 'error' in reply):
+                        return await self.acall_batch_jsonrpc(calls)
+                    return self._batch_results(ids, replies)
+                if replies is not None and not (isinstance(replies, dict) and 'error' in replies):
+                    self.logger.error("Unexpected JSON-RPC batch reply: %s", replies)
+                    return [None] * len(calls)
+                # A 4xx reply, or a single error object from older servers, means
+                # the endpoint does not accept batch arrays
+                self.logger.warning("JSON-RPC batch requests not supported, sending calls individually")
+                self._has_jsonrpc_batch = False
+            
+            return list(await asyncio.gather(*[
+                self._ajsonrpc_execute(model, method, *args) for model, method, args in calls
+            ]))
+        except Exception as e:
+            self.logger.error("Error executing JSON-RPC batch: %s", e)
+            return [None] * len(calls)
+    
+    async def acreate_leads_batch_jsonrpc(self, leads_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create multiple leads in batch using async JSON-RPC.
+        
+        A single multi-record create is tried first; if the server rejects it
+        the leads are created concurrently one by one so partial success is
+        still reported. A create lost to a timeout or dropped connection is
+        not retried, since the server may already have committed it.
+        
+        Args:
+            leads_data (List[Dict[str, Any]]): List of lead data dictionaries
+            
+        Returns:
+            List[int]: List of created lead IDs or empty list if failed
+        """
+        try:
+            self.logger.debug("Creating %s leads in batch via JSON-RPC...", len(leads_data))
+            if not leads_data:
+                return []
+            
+            try:
+                lead_ids = await self._ajsonrpc_execute('crm.lead', 'create', list(leads_data), raise_fault=True) or []
+            except xmlrpc.client.Fault as e:
+                self.logger.warning("Bulk create rejected (%s), falling back to per-record creates", e.faultString)
+                created = await asyncio.gather(*[self.acreate_lead_jsonrpc(d) for d in leads_data])
+                lead_ids = [lead_id for lead_id in created if lead_id]
+            
+            self.logger.info("Successfully created %s leads in batch", len(lead_ids))
+            return lead_ids
+        except Exception as e:
+            self.logger.error("Error creating leads in batch via JSON-RPC: %s", e)
+            return []
+    
+    async def aupdate_leads_batch_jsonrpc(self, leads_updates: Dict[int, Dict[str, Any]]) -> Dict[int, bool]:
+        """
+        Update multiple leads in batch using async JSON-RPC.
+        
+        Leads sharing the same update data are written with one call per group,
+        and the groups are sent concurrently; a group whose write fails is
+        retried record by record.
+        
+        Args:
+            leads_updates (Dict[int, Dict[str, Any]]): Dictionary mapping lead IDs to update data
+            
+        Returns:
+            Dict[int, bool]: Dictionary mapping lead IDs to update success status
+        """
+        try:
+            self.logger.debug("Updating %s leads in batch via JSON-RPC...", len(leads_updates))
+            groups = self._group_updates(leads_updates)
+            written = await asyncio.gather(*[
+                self._ajsonrpc_execute('crm.lead', 'write', lead_ids, update_data)
+                for update_data, lead_ids in groups
+            ])
+            
             results = {}
+            retries = []
+            for (update_data, lead_ids), ok in zip(groups, written):
+                if ok:
+                    results.update(dict.fromkeys(lead_ids, True))
+                else:
+                    retries.extend((lead_id, update_data) for lead_id in lead_ids)
+            if retries:
+                retried = await asyncio.gather(*[self.aupdate_lead_jsonrpc(i, d) for i, d in retries])
+                results.update(zip((lead_id for lead_id, _ in retries), retried))
             
-            for lead_id in lead_ids:
-                success = self.delete_lead_jsonrpc(lead_id)
-                results[lead_id] = success
+            success_count = sum(1 for success in results.values() if success)
+            self.logger.info("Successfully updated %s out of %s leads in batch", success_count, len(leads_updates))
+            return results
+        except Exception as e:
+            self.logger.error("Error updating leads in batch via JSON-RPC: %s", e)
+            return {}
+    
+    async def aunlink_leads_jsonrpc(self, lead_ids: List[int]) -> bool:
+        """
+        Delete multiple leads with a single async JSON-RPC unlink.
+        
+        Unlike adelete_leads_batch_jsonrpc there is no per-record fallback:
+        Odoo deletes all of the leads or none of them.
+        
+        Args:
+            lead_ids (List[int]): List of lead IDs to delete
+            
+        Returns:
+            bool: True if all leads were deleted, False otherwise
+        """
+        lead_ids = list(lead_ids)
+        if not lead_ids:
+            return True
+        self.logger.info("Deleting %s leads via JSON-RPC...", len(lead_ids))
+        result = await self._ajsonrpc_execute('crm.lead', 'unlink', lead_ids)
+        if result:
+            self.logger.info("Deleted %s leads", len(lead_ids))
+        else:
+            self.logger.warning("Failed to delete %s leads", len(lead_ids))
+        return bool(result)
+    
+    async def adelete_leads_batch_jsonrpc(self, lead_ids: List[int]) -> Dict[int, bool]:
+        """
+        Delete multiple leads in batch using async JSON-RPC.
+        
+        All leads are unlinked with one call; if that fails they are deleted
+        concurrently one by one so partial success is still reported.
+        
+        Args:
+            lead_ids (List[int]): List of lead IDs to delete
+            
+        Returns:
+            Dict[int, bool]: Dictionary mapping lead IDs to deletion success status
+        """
+        try:
+            self.logger.debug("Deleting %s leads in batch via JSON-RPC...", len(lead_ids))
+            lead_ids = list(lead_ids)
+            
+            if lead_ids and await self._ajsonrpc_execute('crm.lead', 'unlink', lead_ids):
+                results = dict.fromkeys(lead_ids, True)
+            else:
+                deleted = await asyncio.gather(*[self.adelete_lead_jsonrpc(i) for i in lead_ids])
+                results = dict(zip(lead_ids, deleted))
             
             success_count = sum(1 for success in results.values() if success)
-            self.logger.info(f"Successfully deleted {success_count} out of {len(lead_ids)} leads in batch")
+            self.logger.info("Successfully deleted %s out of %s leads in batch", success_count, len(lead_ids))
             return results
         except Exception as e:
-            self.logger.error(f"Error deleting leads in batch via JSON-RPC: {str(e)}")
+            self.logger.error("Error deleting leads in batch via JSON-RPC: %s", e)
             return {}
 
 
-def demo_usage():
+class _BatchFuture(Future):
     """
-    Demonstrate usage of the OdooAPI class with examples for each operation.
+    Future for a queued RPCBatch call; asking for its result flushes the batch.
     """
-    # Configuration
-    odoo_url = "http://localhost:8069"
-    odoo_db = "odoo"
-    odoo_username = "admin"
-    odoo_password = "admin"
     
-    # Initialize API
-    api = OdooAPI(odoo_url, odoo_db, odoo_username, odoo_password)
+    def __init__(self, batch: 'RPCBatch'):
+        super().__init__()
+        self._batch = batch
     
-    print("\n" + "="*80)
-    print("ODOO CRM API DEMONSTRATION")
-    print("="*80)
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if not self.done():
+            self._batch.flush()
+        return super().result(timeout)
+
+
+class RPCBatch:
+    """
+    Queue execute_kw calls and send them to Odoo as one JSON-RPC batch.
     
-    # Authentication Demo
-    print("\n1. Authentication")
-    print("-"*40)
+    Each queued call returns a Future. The queue is flushed when the block
+    exits, or earlier when a pending Future's result is requested, so a
+    read that depends on an earlier call only waits for the calls queued
+    before it. Failed calls resolve to None, like the rest of OdooAPI.
     
-    print("\nXML-RPC Authentication:")
-    if api.xmlrpc_authenticate():
-        print(f"✓ Success! User ID: {api.uid}")
-    else:
-        print("✗ Failed to authenticate via XML-RPC")
+    Calls in one flush are sent in queue order. A server that may process
+    a batch concurrently needs an earlier result requested first when a
+    later call depends on its effects.
     
-    print("\nJSON-RPC Authentication:")
-    if api.jsonrpc_authenticate():
-        print(f"✓ Success! User ID: {api.uid}")
-    else:
-        print("✗ Failed to authenticate via JSON-RPC")
-    
-    # CRUD Operations Demo
-    print("\n2. CRUD Operations")
-    print("-"*40)
-    
-    # Create Lead Demo
-    print("\nCreating a lead via XML-RPC:")
-    lead_data = {
-        'name': f"Test Lead XML-RPC {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        'partner_name': 'Test Company',
-        'contact_name': 'John Doe',
-        'email_from': 'john.doe@example.com',
-        'phone': '+1234567890',
-        'description': 'This is a test lead created via XML-RPC'
-    }
-    lead_id_xmlrpc = api.create_lead_xmlrpc(lead_data)
-    if lead_id_xmlrpc:
-        print(f"✓ Lead created with ID: {lead_id_xmlrpc}")
-    else:
-        print("✗ Failed to create lead")
-    
-    print("\nCreating a lead via JSON-RPC:")
-    lead_data = {
-        'name': f"Test Lead JSON-RPC {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        'partner_name': 'Test Company',
-        'contact_name': 'Jane Smith',
-        'email_from': 'jane.smith@example.com',
-        'phone': '+0987654321',
-        'description': 'This is a test lead created via JSON-RPC'
-    }
-    lead_id_jsonrpc = api.create_lead_jsonrpc(lead_data)
-    if lead_id_jsonrpc:
-        print(f"✓ Lead created with ID: {lead_id_jsonrpc}")
-    else:
-        print("✗ Failed to create lead")
+    Example:
+        with api.batch() as tx:
+            a, b = tx.create('crm.lead', [{'name': 'A'}, {'name': 'B'}]).result()
+            # Independent writes share one batch; the read waits for it
+            tx.write('crm.lead', [a], {'description': 'First'})
+            tx.write('crm.lead', [b], {'description': 'Second'}).result()
+            leads = tx.read('crm.lead', [a, b], ['name', 'description'])
+        print(leads.result())
+    """
     
-    # Read Lead Demo
-    if lead_id_xmlrpc:
-        print("\nReading a lead via XML-RPC:")
-        lead_data = api.read_lead_xmlrpc(lead_id_xmlrpc, ['name', 'contact_name', 'email_from', 'phone'])
-        if lead_data:
-            print(f"✓ Lead data: {json.dumps(lead_data, indent=2)}")
-        else:
-            print("✗ Failed to read lead")
+    def __init__(self, api: OdooAPI):
+        self.api = api
+        self._pending = []
     
-    if lead_id_jsonrpc:
-        print("\nReading a lead via JSON-RPC:")
-        lead_data = api.read_lead_jsonrpc(lead_id_jsonrpc, ['name', 'contact_name', 'email_from', 'phone'])
-        if lead_data:
-            print(f"✓ Lead data: {json.dumps(lead_data, indent=2)}")
-        else:
-            print("✗ Failed to read lead")
-    
-    # Update Lead Demo
-    if lead_id_xmlrpc:
-        print("\nUpdating a lead via XML-RPC:")
-        update_data = {
-            'name': f"Updated Test Lead XML-RPC {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            'description': 'This lead was updated via XML-RPC'
-        }
-        if api.update_lead_xmlrpc(lead_id_xmlrpc, update_data):
-            print("✓ Lead updated successfully")
-            # Verify update
-            lead_data = api.read_lead_xmlrpc(lead_id_xmlrpc, ['name', 'description'])
-            print(f"  Updated data: {json.dumps(lead_data, indent=2)}")
-        else:
-            print("✗ Failed to update lead")
+    def __enter__(self) -> 'RPCBatch':
+        return self
     
-    if lead_id_jsonrpc:
-        print("\nUpdating a lead via JSON-RPC:")
-        update_data = {
-            'name': f"Updated Test Lead JSON-RPC {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            'description': 'This lead was updated via JSON-RPC'
-        }
-        if api.update_lead_jsonrpc(lead_id_jsonrpc, update_data):
-            print("✓ Lead updated successfully")
-            # Verify update
-            lead_data = api.read_lead_jsonrpc(lead_id_jsonrpc, ['name', 'description'])
-            print(f"  Updated data: {json.dumps(lead_data, indent=2)}")
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.flush()
         else:
-            print("✗ Failed to update lead")
+            for *_, future in self._pending:
+                future.cancel()
+            self._pending = []
+        return False
     
-    # Search and Filter Demo
-    print("\n3. Search and Filter Operations")
-    print("-"*40)
+    def call(self, model: str, method: str, *args) -> Future:
+        """
+        Queue a method call.
+        
+        Args:
+            model (str): The model name
+            method (str): The method to execute
+            *args: Additional arguments for the method
+            
+        Returns:
+            Future: Resolves to the method's result
+        """
+        future = _BatchFuture(self)
+        self._pending.append((model, method, args, future))
+        return future
     
-    print("\nSearching leads via XML-RPC:")
-    domain = [('name', 'like', 'Test Lead')]
-    lead_ids = api.search_leads_xmlrpc(domain, limit=5, order='id desc')
-    if lead_ids:
-        print(f"✓ Found {len(lead_ids)} leads: {lead_ids}")
-    else:
-        print("✗ No leads found or search failed")
-    
-    print("\nSearch-reading leads via JSON-RPC:")
-    domain = [('name', 'like', 'Test Lead')]
-    fields = ['id', 'name', 'contact_name', 'email_from']
-    leads = api.search_read_leads_jsonrpc(domain, fields, limit=5, order='id desc')
-    if leads:
-        print(f"✓ Found {len(leads)} leads:")
-        for lead in leads:
-            print(f"  - {lead['id']}: {lead['name']} ({lead.get('contact_name', 'N/A')})")
-    else:
-        print("✗ No leads found or search failed")
-    
-    # Batch Operations Demo
-    print("\n4. Batch Operations")
-    print("-"*40)
-    
-    print("\nCreating multiple leads in batch via XML-RPC:")
-    batch_leads = [
-        {
-            'name': f"Batch Lead 1 XML-RPC {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            'partner_name': 'Batch Company 1',
-            'contact_name': 'Batch Contact 1',
-            'email_from': 'batch1@example.com',
-            'description': 'Batch lead 1 via XML-RPC'
-        },
-        {
-            'name': f"Batch Lead 2 XML-RPC {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            'partner_name': 'Batch Company 2',
-            'contact_name': 'Batch Contact 2',
-            'email_from': 'batch2@example.com',
-            'description': 'Batch lead 2 via XML-RPC'
-        }
-    ]
-    batch_lead_ids = api.create_leads_batch_xmlrpc(batch_leads)
-    if batch_lead_ids:
-        print(f"✓ Created {len(batch_lead_ids)} leads in batch: {batch_lead_ids}")
-    else:
-        print("✗ Failed to create leads in batch")
+    def create(self, model: str, values: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Future:
+        return self.call(model, 'create', values)
     
-    if batch_lead_ids:
-        print("\nUpdating multiple leads in batch via XML-RPC:")
-        batch_updates = {
-            lead_id: {'description': f'Updated batch lead {i+1} via XML-RPC'}
-            for i, lead_id in enumerate(batch_lead_ids)
-        }
-        update_results = api.update_leads_batch_xmlrpc(batch_updates)
-        success_count = sum(1 for success in update_results.values() if success)
-        print(f"✓ Successfully updated {success_count} out of {len(batch_updates)} leads")
+    def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> Future:
+        return self.call(model, 'write', list(ids), values)
+    
+    def read(self, model: str, ids: List[int], fields: List[str]) -> Future:
+        return self.call(model, 'read', list(ids), list(fields))
     
-    # Clean up - Delete leads
-    print("\n5. Cleanup - Deleting Test Leads")
-    print("-"*40)
+    def unlink(self, model: str, ids: List[int]) -> Future:
+        return self.call(model, 'unlink', list(ids))
     
-    all_test_leads = []
-    if lead_id_xmlrpc:
-        all_test_leads.append(lead_id_xmlrpc)
-    if lead_id_jsonrpc:
-        all_test_leads.append(lead_id_jsonrpc)
-    all_test_leads.extend(batch_lead_ids)
+    def flush(self) -> None:
+        """
+        Send every queued call in one batch request and resolve their Futures.
+        """
+        pending, self._pending = self._pending, []
+        # Drop cancelled calls so they are neither sent nor resolved
+        pending = [call for call in pending if call[-1].set_running_or_notify_cancel()]
+        if not pending:
+            return
+        try:
+            results = self.api.call_batch_jsonrpc([(model, method, args) for model, method, args, _ in pending])
+        except Exception as e:
+            for *_, future in pending:
+                future.set_exception(e)
+            return
+        results = list(results) + [None] * (len(pending) - len(results))
+        for (*_, future), result in zip(pending, results):
+            future.set_result(result)
+
+
+def _format_json(data: Any) -> str:
+    """
+    Format data for demo output: indented when DEBUG logging is on, compact otherwise.
+    
+    Args:
+        data (Any): JSON-serialisable data
+        
+    Returns:
+        str: JSON text
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        return _json_pretty(data).decode()
+    return _json_encode(data).decode()
+
+
+async def demo_usage():
+    """
+    Demonstrate usage of the OdooAPI class with examples for each operation.
+    
+    Independent steps run concurrently: blocking XML-RPC calls in worker
+    threads, JSON-RPC calls as coroutines on the shared aiohttp session.
+    """
+    # Configuration
+    odoo_url = "http://localhost:8069"
+    odoo_db = "odoo"
+    odoo_username = "admin"
+    odoo_password = "admin"
+    
+    # Initialize API
+    api = OdooAPI(odoo_url, odoo_db, odoo_username, odoo_password)
     
-    if all_test_leads:
-        print(f"\nDeleting {len(all_test_leads)} test leads in batch via JSON-RPC:")
-        delete_results = api.delete_leads_batch_jsonrpc(all_test_leads)
-        success_count = sum(1 for success in delete_results.values() if success)
-        print(f"✓ Successfully deleted {success_count} out of {len(all_test_leads)} leads")
+    # One timestamp for every lead name in this run, and the size of the batch demo
+    ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    batch_size = 2
     
-    print("\n" + "="*80)
-    print("DEMONSTRATION COMPLETE")
-    print("="*80)
+    try:
+        print("\n" + "="*80)
+        print("ODOO CRM API DEMONSTRATION")
+        print("="*80)
+        
+        # Authentication Demo
+        print("\n1. Authentication")
+        print("-"*40)
+        
+        xmlrpc_ok, jsonrpc_ok = await asyncio.gather(
+            asyncio.to_thread(api.xmlrpc_authenticate),
+            asyncio.to_thread(api.jsonrpc_authenticate)
+        )
+        
+        print("\nXML-RPC Authentication:")
+        if xmlrpc_ok:
+            print(f"✓ Success! User ID: {api.uid}")
+        else:
+            print("✗ Failed to authenticate via XML-RPC")
+        
+        print("\nJSON-RPC Authentication:")
+        if jsonrpc_ok:
+            print(f"✓ Success! User ID: {api.uid}")
+        else:
+            print("✗ Failed to authenticate via JSON-RPC")
+        
+        # CRUD Operations Demo
+        print("\n2. CRUD Operations")
+        print("-"*40)
+        
+        # Create Lead Demo
+        xmlrpc_lead = {
+            'name': f"Test Lead XML-RPC {ts}",
+            'partner_name': 'Test Company',
+            'contact_name': 'John Doe',
+            'email_from': 'john.doe@example.com',
+            'phone': '+1234567890',
+            'description': 'This is a test lead created via XML-RPC'
+        }
+        jsonrpc_lead = {
+            'name': f"Test Lead JSON-RPC {ts}",
+            'partner_name': 'Test Company',
+            'contact_name': 'Jane Smith',
+            'email_from': 'jane.smith@example.com',
+            'phone': '+0987654321',
+            'description': 'This is a test lead created via JSON-RPC'
+        }
+        lead_id_xmlrpc, lead_id_jsonrpc = await asyncio.gather(
+            asyncio.to_thread(api.create_lead_xmlrpc, xmlrpc_lead),
+            api.acreate_lead_jsonrpc(jsonrpc_lead)
+        )
+        
+        print("\nCreating a lead via XML-RPC:")
+        if lead_id_xmlrpc:
+            print(f"✓ Lead created with ID: {lead_id_xmlrpc}")
+        else:
+            print("✗ Failed to create lead")
+        
+        print("\nCreating a lead via JSON-RPC:")
+        if lead_id_jsonrpc:
+            print(f"✓ Lead created with ID: {lead_id_jsonrpc}")
+        else:
+            print("✗ Failed to create lead")
+        
+        # Read Lead Demo
+        read_fields = ['name', 'contact_name', 'email_from', 'phone']
+        xmlrpc_read, jsonrpc_read = await asyncio.gather(
+            asyncio.to_thread(api.read_lead_xmlrpc, lead_id_xmlrpc, read_fields) if lead_id_xmlrpc else asyncio.sleep(0),
+            api.aread_lead_jsonrpc(lead_id_jsonrpc, read_fields) if lead_id_jsonrpc else asyncio.sleep(0)
+        )
+        
+        if lead_id_xmlrpc:
+            print("\nReading a lead via XML-RPC:")
+            if xmlrpc_read:
+                print(f"✓ Lead data: {_format_json(xmlrpc_read)}")
+            else:
+                print("✗ Failed to read lead")
+        
+        if lead_id_jsonrpc:
+            print("\nReading a lead via JSON-RPC:")
+            if jsonrpc_read:
+                print(f"✓ Lead data: {_format_json(jsonrpc_read)}")
+            else:
+                print("✗ Failed to read lead")
+        
+        # Update and Search Demo: the updates and both searches are independent.
+        # A successful write stores exactly what was sent, so the updated data is
+        # only read back from the server when AICRM_VERIFY=1.
+        verify = os.getenv('AICRM_VERIFY') == '1'
+        
+        def update_and_verify_xmlrpc():
+            update_data = {
+                'name': f"Updated Test Lead XML-RPC {ts}",
+                'description': 'This lead was updated via XML-RPC'
+            }
+            if not api.update_lead_xmlrpc(lead_id_xmlrpc, update_data):
+                return None
+            if verify:
+                return api.read_lead_xmlrpc(lead_id_xmlrpc, ['name', 'description'])
+            return dict(update_data, id=lead_id_xmlrpc)
+        
+        def update_and_verify_jsonrpc():
+            update_data = {
+                'name': f"Updated Test Lead JSON-RPC {ts}",
+                'description': 'This lead was updated via JSON-RPC'
+            }
+            if verify:
+                # web_save returns the updated fields, so verifying costs no extra round trip
+                return api.update_and_read_lead_jsonrpc(lead_id_jsonrpc, update_data, ['name', 'description'])
+            if not api.update_lead_jsonrpc(lead_id_jsonrpc, update_data):
+                return None
+            return dict(update_data, id=lead_id_jsonrpc)
+        
+        domain = [('name', 'like', 'Test Lead')]
+        fields = ['id', 'name', 'contact_name', 'email_from']
+        # Both searches travel in one JSON-RPC batch request
+        searches = [
+            ('crm.lead', 'search', (domain, {'limit': 5, 'order': 'id desc'})),
+            ('crm.lead', 'search_read', (domain, {'fields': fields, 'limit': 5, 'order': 'id desc'})),
+        ]
+        xmlrpc_updated, jsonrpc_updated, (lead_ids, leads) = await asyncio.gather(
+            asyncio.to_thread(update_and_verify_xmlrpc) if lead_id_xmlrpc else asyncio.sleep(0),
+            asyncio.to_thread(update_and_verify_jsonrpc) if lead_id_jsonrpc else asyncio.sleep(0),
+            api.acall_batch_jsonrpc(searches)
+        )
+        
+        if lead_id_xmlrpc:
+            print("\nUpdating a lead via XML-RPC:")
+            if xmlrpc_updated:
+                print("✓ Lead updated successfully")
+                print(f"  Updated data: {_format_json(xmlrpc_updated)}")
+            else:
+                print("✗ Failed to update lead")
+        
+        if lead_id_jsonrpc:
+            print("\nUpdating a lead via JSON-RPC:")
+            if jsonrpc_updated:
+                print("✓ Lead updated successfully")
+                print(f"  Updated data: {_format_json(jsonrpc_updated)}")
+            else:
+                print("✗ Failed to update lead")
+        
+        # Search and Filter Demo
+        print("\n3. Search and Filter Operations")
+        print("-"*40)
+        
+        print("\nSearching leads via JSON-RPC batch:")
+        if lead_ids:
+            print(f"✓ Found {len(lead_ids)} leads: {lead_ids}")
+        else:
+            print("✗ No leads found or search failed")
+        
+        print("\nSearch-reading leads via JSON-RPC batch:")
+        if leads:
+            print(f"✓ Found {len(leads)} leads:")
+            for lead in leads:
+                print(f"  - {lead['id']}: {lead['name']} ({lead.get('contact_name', 'N/A')})")
+        else:
+            print("✗ No leads found or search failed")
+        
+        # Batch Operations Demo
+        print("\n4. Batch Operations")
+        print("-"*40)
+        
+        print("\nCreating multiple leads in batch via XML-RPC:")
+        batch_leads = [
+            {
+                'name': f"Batch Lead {i} XML-RPC {ts}",
+                'partner_name': f'Batch Company {i}',
+                'contact_name': f'Batch Contact {i}',
+                'email_from': f'batch{i}@example.com',
+                'description': f'Batch lead {i} via XML-RPC'
+            }
+            for i in range(1, batch_size + 1)
+        ]
+        batch_lead_ids = await asyncio.to_thread(api.create_leads_batch_xmlrpc, batch_leads)
+        if batch_lead_ids:
+            print(f"✓ Created {len(batch_lead_ids)} leads in batch: {batch_lead_ids}")
+        else:
+            print("✗ Failed to create leads in batch")
+        
+        if batch_lead_ids:
+            print("\nUpdating multiple leads in batch via XML-RPC:")
+            # Every lead gets the same values, so one write covers the whole batch
+            update_data = {'description': 'Updated batch lead via XML-RPC'}
+            if await asyncio.to_thread(api.update_leads_uniform_xmlrpc, batch_lead_ids, update_data):
+                print(f"✓ Successfully updated {len(batch_lead_ids)} leads with one write")
+            else:
+                print("✗ Failed to update leads in batch")
+        
+        # Clean up - Delete leads
+        print("\n5. Cleanup - Deleting Test Leads")
+        print("-"*40)
+        
+        all_test_leads = []
+        if lead_id_xmlrpc:
+            all_test_leads.append(lead_id_xmlrpc)
+        if lead_id_jsonrpc:
+            all_test_leads.append(lead_id_jsonrpc)
+        all_test_leads.extend(batch_lead_ids)
+        
+        if all_test_leads:
+            print(f"\nDeleting {len(all_test_leads)} test leads with one JSON-RPC unlink:")
+            if await api.aunlink_leads_jsonrpc(all_test_leads):
+                print(f"✓ Successfully deleted {len(all_test_leads)} leads")
+            else:
+                print("✗ Failed to delete test leads")
+        
+        print("\n" + "="*80)
+        print("DEMONSTRATION COMPLETE")
+        print("="*80)
+    finally:
+        await api.aclose()
+        api.close()
 
 
 if __name__ == "__main__":
     try:
-        demo_usage()
+        # uvloop's event loop is a drop-in, faster replacement where available
+        (uvloop.run if uvloop is not None else asyncio.run)(demo_usage())
     except KeyboardInterrupt:
         print("\nDemonstration interrupted by user.")
     except Exception as e:
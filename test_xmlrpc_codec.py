@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Round-trip checks for the lxml XML-RPC codec in odoo_api_demo against xmlrpc.client.
+
+Run with: python -m unittest test_xmlrpc_codec
+"""
+
+import unittest
+import xmlrpc.client
+from datetime import datetime
+
+import odoo_api_demo as api
+
+# Values covering every type the codec marshals, including nesting
+SAMPLES = [
+    None,
+    True,
+    False,
+    0,
+    -42,
+    2**31 - 1,
+    -2**31,
+    3.5,
+    -0.1,
+    "",
+    "plain",
+    "unicode ✓ éè",
+    "markup <b> & \"quotes\" 'apostrophes'",
+    "  surrounding whitespace  ",
+    b"\x00\x01binary\xff",
+    datetime(2024, 2, 29, 13, 45, 7),
+    [],
+    [1, "two", 3.0, None, False],
+    {},
+    {"name": "Lead", "id": 7, "tags": [1, 2], "partner_id": [3, "Company"], "active": True},
+    {"nested": {"deep": [{"x": 1}, {"y": [None, "z"]}]}},
+]
+
+
+@unittest.skipIf(api.etree is None, "lxml is not installed")
+class XmlrpcCodecTest(unittest.TestCase):
+    """
+    The lxml codec must read and write exactly what xmlrpc.client does.
+    """
+
+    def test_dumps_matches_stdlib(self):
+        for value in SAMPLES:
+            with self.subTest(value=value):
+                body = api._xmlrpc_dumps_fast(("db", 2, "pw", "crm.lead", "read", (value,)), "execute_kw")
+                params, method = xmlrpc.client.loads(body, use_builtin_types=True)
+                expected, _ = xmlrpc.client.loads(
+                    xmlrpc.client.dumps(("db", 2, "pw", "crm.lead", "read", (value,)), "execute_kw", allow_none=True),
+                    use_builtin_types=True
+                )
+                self.assertEqual(method, "execute_kw")
+                self.assertEqual(params, expected)
+
+    def test_loads_matches_stdlib(self):
+        for value in SAMPLES:
+            with self.subTest(value=value):
+                body = xmlrpc.client.dumps((value,), methodresponse=True, allow_none=True).encode()
+                expected = xmlrpc.client.loads(body, use_builtin_types=True)[0][0]
+                self.assertEqual(api._xmlrpc_loads_fast(body), expected)
+
+    def test_round_trip(self):
+        for value in SAMPLES:
+            with self.subTest(value=value):
+                body = api._xmlrpc_dumps_fast((value,), "echo")
+                (param,), _ = xmlrpc.client.loads(body, use_builtin_types=True)
+                response = xmlrpc.client.dumps((param,), methodresponse=True, allow_none=True).encode()
+                expected = xmlrpc.client.loads(response, use_builtin_types=True)[0][0]
+                self.assertEqual(api._xmlrpc_loads_fast(response), expected)
+
+    def test_tuple_marshals_as_array(self):
+        body = api._xmlrpc_dumps_fast(((1, "a"),), "echo")
+        self.assertEqual(xmlrpc.client.loads(body)[0], ([1, "a"],))
+
+    def test_large_int_uses_i8(self):
+        value = 2**40
+        body = api._xmlrpc_dumps_fast((value, -value), "echo")
+        self.assertIn(b"<i8>", body)
+        self.assertEqual(xmlrpc.client.loads(body)[0], (value, -value))
+        response = b"<methodResponse><params><param><value><i8>%d</i8></value></param></params></methodResponse>" % value
+        self.assertEqual(api._xmlrpc_loads_fast(response), value)
+
+    def test_bare_value_is_string(self):
+        response = b"<methodResponse><params><param><value>text</value></param></params></methodResponse>"
+        self.assertEqual(api._xmlrpc_loads_fast(response), "text")
+        self.assertEqual(api._xmlrpc_loads_fast(response), xmlrpc.client.loads(response)[0][0])
+
+    def test_i4_is_int(self):
+        response = b"<methodResponse><params><param><value><i4>-7</i4></value></param></params></methodResponse>"
+        self.assertEqual(api._xmlrpc_loads_fast(response), -7)
+
+    def test_fault_raises(self):
+        body = xmlrpc.client.dumps(xmlrpc.client.Fault(2, "Access Denied")).encode()
+        with self.assertRaises(xmlrpc.client.Fault) as ctx:
+            api._xmlrpc_loads_fast(body)
+        self.assertEqual(ctx.exception.faultCode, 2)
+        self.assertEqual(ctx.exception.faultString, "Access Denied")
+
+    def test_unsupported_type_raises(self):
+        with self.assertRaises(TypeError):
+            api._xmlrpc_dumps_fast((object(),), "echo")
+
+    def test_entities_are_not_resolved(self):
+        response = (
+            b'<?xml version="1.0"?><!DOCTYPE r [<!ENTITY e "expanded">]>'
+            b"<methodResponse><params><param><value><string>&e;</string></value></param></params></methodResponse>"
+        )
+        self.assertNotEqual(api._xmlrpc_loads_fast(response), "expanded")
+
+
+if __name__ == "__main__":
+    unittest.main()